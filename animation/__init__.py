@@ -6,24 +6,30 @@ This package provides a framework for creating and sequencing animations
 for the Unicorn HAT Mini.
 """
 
-from .base import Animation
+import logging
+
+from .base import Animation, TransitionAnimation, FadeTransition, enable_debug_output
 from .registry import (
     register_animation,
+    register_animation_as,
+    register_alias,
     get_animation_class,
     get_animation_names,
     create_animation,
     discover_animations
 )
-from .sequencer import (
-    AnimationSequencer,
-    # TransitionAnimation,
-    # FadeTransition
-)
+from .sequencer import AnimationSequencer
+
+# Drop log records silently unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 # Define exports
 __all__ = [
     'Animation',
+    'enable_debug_output',
     'register_animation',
+    'register_animation_as',
+    'register_alias',
     'get_animation_class',
     'get_animation_names',
     'create_animation',
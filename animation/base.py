@@ -1,24 +1,174 @@
 #!/usr/bin/env python3
 """
-Animation Base with Enhanced Debugging for Unicorn HAT Mini
+Animation base classes for Unicorn HAT Mini.
 
-This file provides enhanced versions of the animation base classes
-with improved debugging output. To use these, replace or modify
-your existing animation/base.py with this content.
+This module defines the Animation base class, with built-in debugging
+output, and the transition animations used by the sequencer.
 """
 
+import sys
 import time
-import abc
-import inspect
+import atexit
+import logging
+import threading
+import functools
+import collections
+from collections import OrderedDict
 
+import numpy as np
 
-class Animation(abc.ABC):
+logger = logging.getLogger(__name__)
+
+# Format strings for the recurring debug messages. They are passed to the
+# logger with their arguments, so the message is only built if a record
+# is actually emitted.
+_CREATED_FMT = "Created animation: %s (duration: %ss)"
+_ENDED_FMT = "Ending animation: %s (ran for %.2fs)"
+_FRAME_FMT = ("Animation: %s - Frame: %d, FPS: %.1f, Elapsed: %.2fs, "
+              "dt: %.4fs, Remaining: %.2fs")
+_FADE_FMT = "Fade transition: %s → %s, Progress: %.2f"
+
+# Display attributes holding the button numbers
+_BUTTON_NAMES = ('BUTTON_A', 'BUTTON_B', 'BUTTON_X', 'BUTTON_Y')
+
+# Debug records are appended to a fixed-size ring buffer and written to
+# stderr by a background thread, so the render loop never blocks on the
+# console. When the buffer is full the oldest records are dropped.
+_debug_queue = collections.deque(maxlen=512)
+_debug_ready = threading.Event()
+_drain_thread = None
+_debug_handler = None
+
+
+class RingBufferHandler(logging.Handler):
+    """Logging handler that queues records for the background drain thread."""
+    
+    def emit(self, record):
+        """Queue a record without formatting or writing it."""
+        _debug_queue.append(record)
+        _debug_ready.set()
+
+
+def _flush_debug_queue():
+    """Format and write all queued records in a single write call."""
+    batch = []
+    while True:
+        try:
+            record = _debug_queue.popleft()
+        except IndexError:
+            break
+        try:
+            batch.append(_debug_handler.format(record))
+        except Exception:
+            _debug_handler.handleError(record)
+    
+    if batch:
+        sys.stderr.write("\n".join(batch) + "\n")
+        sys.stderr.flush()
+
+
+def _drain():
+    """Background loop that drains the debug ring buffer."""
+    while True:
+        _debug_ready.wait(0.5)
+        _debug_ready.clear()
+        _flush_debug_queue()
+
+
+def enable_debug_output(level=logging.DEBUG, fmt='[%(levelname)s] %(message)s'):
+    """Write animation log records to stderr from a background thread.
+    
+    Args:
+        level: Logging level for the animation package logger
+        fmt: Format string used for each record
+    """
+    global _drain_thread, _debug_handler
+    
+    package_logger = logging.getLogger(__name__.rpartition('.')[0])
+    package_logger.setLevel(level)
+    
+    if _debug_handler is None:
+        _debug_handler = RingBufferHandler()
+        _debug_handler.setFormatter(logging.Formatter(fmt))
+        package_logger.addHandler(_debug_handler)
+        
+        _drain_thread = threading.Thread(target=_drain, name="animation-debug", daemon=True)
+        _drain_thread.start()
+        
+        # Write out anything still queued when the process exits
+        atexit.register(_flush_debug_queue)
+
+
+class _BufferDisplay:
+    """Stand-in display that draws into a (height, width, 3) uint8 array.
+    
+    Used by Animation.render_to_buffer(). Anything other than drawing is
+    passed through to the real display.
+    """
+    
+    __slots__ = ('buffer', 'display')
+    
+    def __init__(self, buffer, display):
+        self.buffer = buffer
+        self.display = display
+    
+    def get_shape(self):
+        height, width = self.buffer.shape[:2]
+        return width, height
+    
+    def set_pixel(self, x, y, r, g, b):
+        height, width = self.buffer.shape[:2]
+        if 0 <= x < width and 0 <= y < height:
+            self.buffer[y, x] = (r, g, b)
+    
+    def set_all(self, r, g, b):
+        self.buffer[:] = (r, g, b)
+    
+    def clear(self):
+        self.buffer.fill(0)
+    
+    def set_array(self, array):
+        self.buffer[:] = array
+    
+    def show(self):
+        pass
+    
+    def __getattr__(self, name):
+        return getattr(self.display, name)
+
+
+class Animation:
     """Base class for all animations with enhanced debugging.
     
-    This abstract class defines the interface that all animations must implement
+    This class defines the interface that all animations must implement
     to work with the animation sequencer system.
     """
     
+    # True when update() redraws the whole display, or clears it first,
+    # so a transition does not need to clear the display before calling it
+    opaque = False
+    
+    __slots__ = (
+        'display', 'config', 'width', 'height',
+        'start_time', 'start_time_ns', 'is_running', 'debug_count',
+        'name', 'duration', 'frame_rate', 'frame_delay_ns', 'last_frame_time_ns',
+        'debug_level', 'debug_frequency',
+        '_interactive', '_debug_enabled', '_verbose', '_report_every',
+        '_report_countdown', '_deadline_ns', '_precise_timing', 'run_frame',
+        '_set_array', '_pixel_coords',
+    )
+    
+    def __init_subclass__(cls, abstract=False, **kwargs):
+        """Check that concrete animation classes define update(dt).
+        
+        The check runs once when a subclass is defined rather than on
+        every instantiation. Intermediate base classes can opt out with
+        ``class Base(Animation, abstract=True)``.
+        """
+        super().__init_subclass__(**kwargs)
+        if not abstract and cls.update is Animation.update:
+            raise TypeError(f"{cls.__name__} must define update(dt)")
+    
     def __init__(self, display, config=None):
         """Initialize the animation.
         
@@ -29,7 +179,16 @@ class Animation(abc.ABC):
         self.display = display
         self.config = config or {}
         self.width, self.height = display.get_shape()
+        
+        # Bulk frame upload, if the display supports it (see blit()).
+        # Otherwise blit() sets pixels in row-major order from this list
+        self._set_array = getattr(display, 'set_array', None)
+        self._pixel_coords = None
+        if self._set_array is None:
+            self._pixel_coords = [(x, y) for y in range(self.height) for x in range(self.width)]
+        
         self.start_time = None
+        self.start_time_ns = None
         self.is_running = False
         self.debug_count = 0  # Frame counter for rate-limited debug output
         
@@ -37,18 +196,40 @@ class Animation(abc.ABC):
         self.name = self.config.get('name', self.__class__.__name__)
         self.duration = self.config.get('duration', 5.0)
         self.frame_rate = self.config.get('frame_rate', 30)
-        self.frame_delay = 1.0 / self.frame_rate
-        self.last_frame_time = 0
+        self.frame_delay_ns = 1_000_000_000 // self.frame_rate
+        self.last_frame_time_ns = 0
+        
+        # Busy-wait the last millisecond of each frame for exact pacing
+        self._precise_timing = bool(self.config.get('precise_timing', False))
         
         # Debug control
         self.debug_level = self.config.get('debug_level', 1)  # 0=none, 1=basic, 2=verbose
         self.debug_frequency = self.config.get('debug_frequency', 30)  # Every Nth frame
         
+        # Resolve settings read on every frame once, up front
+        self._interactive = bool(self.config.get('interactive', False))
+        self._debug_enabled = self.debug_level >= 1
+        self._verbose = self.debug_level >= 2
+        self._report_every = self.debug_frequency
+        self._report_countdown = 1
+        
+        # Pick the frame runner once: with debugging off, run_frame() skips
+        # the frame counter and all logging checks
+        if self.debug_level == 0:
+            self.run_frame = self._run_frame_fast
+        else:
+            self.run_frame = self._run_frame_debug
+        
+        # Time at which the animation finishes (None for interactive
+        # animations); until setup() runs the animation counts as finished
+        self._deadline_ns = 0
+        
         # Debug initialization
-        print(f"[DEBUG] Created animation: {self.name} (duration: {self.duration}s)")
-        if self.debug_level >= 2:
-            # Print configuration details
-            print(f"[DEBUG] Configuration: {self.config}")
+        if self.debug_level >= 1 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_CREATED_FMT, self.name, self.duration)
+            if self.debug_level >= 2:
+                # Log configuration details
+                logger.debug("Configuration: %s", self.config)
             
     def setup(self):
         """Prepare the animation to run.
@@ -56,19 +237,24 @@ class Animation(abc.ABC):
         This method is called once before the animation starts running.
         It should initialize any state needed by the animation.
         """
-        self.start_time = time.time()
-        self.last_frame_time = self.start_time
+        self.start_time_ns = time.monotonic_ns()
+        self.start_time = self.start_time_ns / 1e9  # Same clock as time.monotonic()
+        self.last_frame_time_ns = self.start_time_ns
         self.is_running = True
         self.debug_count = 0
+        self._report_countdown = 1  # Report on the first frame
+        self._interactive = bool(self.config.get('interactive', False))
+        self._deadline_ns = None if self._interactive else self.start_time_ns + int(self.duration * 1e9)
         
         # Debug setup
-        print(f"\n[DEBUG] Starting animation: {self.name}")
-        if self.debug_level >= 2:
-            # Add more detailed setup information
-            print(f"[DEBUG] Setup time: {time.strftime('%H:%M:%S')}")
-            print(f"[DEBUG] Animation class: {self.__class__.__module__}.{self.__class__.__name__}")
+        if self.debug_level >= 1 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starting animation: %s", self.name)
+            if self.debug_level >= 2:
+                # Add more detailed setup information
+                logger.debug("Setup time: %s", time.strftime('%H:%M:%S'))
+                logger.debug("Animation class: %s.%s",
+                             self.__class__.__module__, self.__class__.__name__)
     
-    @abc.abstractmethod
     def update(self, dt):
         """Update the animation state and render one frame.
         
@@ -78,7 +264,39 @@ class Animation(abc.ABC):
         Args:
             dt: Time in seconds since the last update
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement update(dt)")
+    
+    def blit(self, rgb):
+        """Draw a full frame from an array of RGB values.
+        
+        Args:
+            rgb: NumPy array of shape (height, width, 3) with values 0-255
+        """
+        if self._set_array is not None:
+            self._set_array(rgb)
+            return
+        
+        # Fall back to setting the pixels one at a time
+        set_pixel = self.display.set_pixel
+        for (x, y), (r, g, b) in zip(self._pixel_coords, rgb.reshape(-1, 3).tolist()):
+            set_pixel(x, y, r, g, b)
+    
+    def render_to_buffer(self, buffer, dt):
+        """Run update(dt), drawing into an array instead of the display.
+        
+        Args:
+            buffer: NumPy uint8 array of shape (height, width, 3) to draw into
+            dt: Time in seconds since the last update
+        """
+        capture = _BufferDisplay(buffer, self.display)
+        display, set_array = self.display, self._set_array
+        self.display, self._set_array = capture, capture.set_array
+        try:
+            if not self.opaque:
+                buffer.fill(0)
+            self.update(dt)
+        finally:
+            self.display, self._set_array = display, set_array
     
     def render(self):
         """Render the current state to the display.
@@ -97,36 +315,40 @@ class Animation(abc.ABC):
         self.is_running = False
         
         # Debug cleanup
-        elapsed = time.time() - self.start_time
-        print(f"[DEBUG] Ending animation: {self.name} (ran for {elapsed:.2f}s)")
+        if self.debug_level >= 1 and logger.isEnabledFor(logging.DEBUG):
+            elapsed = (time.monotonic_ns() - self.start_time_ns) / 1e9
+            logger.debug(_ENDED_FMT, self.name, elapsed)
     
-    def is_finished(self):
+    def is_finished(self, _monotonic=time.monotonic_ns):
         """Return True if the animation has completed.
         
         By default, animations finish after their duration has elapsed.
         Interactive animations can override this to continue until an
         event occurs.
         
+        The clock is bound as a default argument so the per-frame call
+        reads a local rather than looking up the time module.
+        
         Returns:
             bool: True if the animation is finished
         """
-        if self.start_time is None:
-            return True
-            
-        # Check if time is up for non-interactive animations
-        if not self.config.get('interactive', False):
-            elapsed = time.time() - self.start_time
-            remaining = self.duration - elapsed
-            is_done = elapsed > self.duration
-            
-            # Print remaining time occasionally
-            if self.debug_level >= 1 and self.debug_count % self.debug_frequency == 0:
-                print(f"[DEBUG] Animation: {self.name} - Time remaining: {remaining:.2f}s")
-            
-            return is_done
+        # Interactive animations have no deadline and continue until
+        # explicitly finished
+        return self._deadline_ns is not None and _monotonic() >= self._deadline_ns
+    
+    def state_hash(self):
+        """Return a hashable key identifying the frame update() would draw.
         
-        # Interactive animations continue until explicitly finished
-        return False
+        Animations whose output is fully determined by a few values can
+        return them here, letting transitions reuse a frame they have
+        already rendered instead of calling update() again. The key must
+        capture everything update() depends on, so stateful animations
+        should keep the default.
+        
+        Returns:
+            A hashable key, or None if frames cannot be cached
+        """
+        return None
     
     def handle_button_press(self, button):
         """Handle a button press event.
@@ -137,37 +359,76 @@ class Animation(abc.ABC):
         Returns:
             bool: True if the button press was handled, False otherwise
         """
-        if self.debug_level >= 2:
-            print(f"[DEBUG] {self.name} - Button press: {button} (not handled)")
+        if self._verbose and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - Button press: %s (not handled)", self.name, button)
         return False
     
-    def throttle_frame_rate(self):
+    def get_button_handlers(self):
+        """Return the button handlers for this animation.
+        
+        The sequencer builds its button dispatch table from these when the
+        animation becomes current. Each handler takes no arguments and
+        returns True if it handled the press. By default, animations that
+        override handle_button_press() get a handler for each display
+        button that forwards to it, and other animations handle no buttons.
+        
+        Returns:
+            dict: Mapping of button to handler
+        """
+        if type(self).handle_button_press is Animation.handle_button_press:
+            return {}
+        
+        buttons = (getattr(self.display, name, None) for name in _BUTTON_NAMES)
+        return {
+            button: functools.partial(self.handle_button_press, button)
+            for button in buttons if button is not None
+        }
+    
+    def throttle_frame_rate(self, _monotonic=time.monotonic_ns, _sleep=time.sleep):
         """Throttle the frame rate to the configured value.
         
+        Frame timing uses integer nanoseconds from the monotonic clock, so
+        it is unaffected by wall-clock adjustments. The clock and sleep
+        functions are bound as default arguments to avoid global lookups
+        on every frame.
+        
+        With the 'precise_timing' config option the method sleeps until
+        about a millisecond before the deadline and then spins, since
+        time.sleep() only has millisecond granularity and tends to
+        oversleep. This costs CPU, so it is off by default.
+        
         Returns:
             float: Time in seconds since the last frame
         """
-        current_time = time.time()
-        dt = current_time - self.last_frame_time
-        
-        # Wait until it's time for the next frame
-        time_to_next_frame = self.frame_delay - dt
-        if time_to_next_frame > 0:
-            time.sleep(time_to_next_frame)
-            current_time = time.time()
-            dt = current_time - self.last_frame_time
+        prev = self.last_frame_time_ns
+        deadline = prev + self.frame_delay_ns
+        remaining = deadline - _monotonic()
+        
+        if self._precise_timing:
+            # Coarse sleep, then spin for the final stretch
+            if remaining > 2_000_000:
+                _sleep((remaining - 1_000_000) / 1e9)
+            while _monotonic() < deadline:
+                pass
+        elif remaining > 1_000_000:
+            # Wait until it's time for the next frame; sleeps shorter than
+            # a millisecond overshoot the deadline, so skip them
+            _sleep(remaining / 1e9)
             
-        self.last_frame_time = current_time
-        return dt
+        self.last_frame_time_ns = _monotonic()
+        return (self.last_frame_time_ns - prev) / 1e9
     
-    def run_frame(self):
+    def _run_frame_debug(self):
         """Run a single frame of the animation.
         
+        Used as run_frame() when debug_level is 1 or higher.
+        
         Returns:
             bool: True if the animation is still running, False if finished
         """
         if not self.is_running:
-            print(f"[DEBUG] Animation not running: {self.name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Animation not running: %s", self.name)
             return False
             
         # Increment debug frame counter
@@ -176,16 +437,20 @@ class Animation(abc.ABC):
         # Throttle frame rate and get elapsed time
         dt = self.throttle_frame_rate()
         
-        # Output debugging information at specified frequency
-        if self.debug_level >= 1 and self.debug_count % self.debug_frequency == 0:
-            elapsed = time.time() - self.start_time
+        # Output one status line on the first frame and then at the
+        # specified frequency
+        debug_enabled = self._debug_enabled and logger.isEnabledFor(logging.DEBUG)
+        self._report_countdown -= 1
+        if self._report_countdown <= 0:
+            self._report_countdown = self._report_every
+        if debug_enabled and self._report_countdown == self._report_every:
+            elapsed = (self.last_frame_time_ns - self.start_time_ns) / 1e9
             fps = 1.0 / dt if dt > 0 else 0
-            print(f"[DEBUG] Animation: {self.name} - Frame: {self.debug_count}, FPS: {fps:.1f}, Elapsed: {elapsed:.2f}s")
-        
-        # Add more detailed debug for verbose mode
-        if self.debug_level >= 2 and self.debug_count % (self.debug_frequency * 5) == 0:
-            # Add memory info or other stats in verbose mode
-            print(f"[DEBUG] {self.name} - Detail: dt={dt:.4f}s")
+            if self._deadline_ns is None:
+                remaining = float('inf')
+            else:
+                remaining = (self._deadline_ns - self.last_frame_time_ns) / 1e9
+            logger.debug(_FRAME_FMT, self.name, self.debug_count, fps, elapsed, dt, remaining)
         
         # Update animation state
         self.update(dt)
@@ -195,20 +460,70 @@ class Animation(abc.ABC):
         
         # Check if animation is finished
         if self.is_finished():
-            if self.debug_level >= 1:
-                print(f"[DEBUG] Animation finished: {self.name}")
+            if debug_enabled:
+                logger.debug("Animation finished: %s", self.name)
             self.cleanup()
             return False
             
         return True
+    
+    def _run_frame_fast(self):
+        """Run a single frame of the animation without debug bookkeeping.
+        
+        Used as run_frame() when debug_level is 0.
+        
+        Returns:
+            bool: True if the animation is still running, False if finished
+        """
+        if not self.is_running:
+            return False
+        
+        dt = self.throttle_frame_rate()
+        self.update(dt)
+        self.render()
+        
+        if self.is_finished():
+            self.cleanup()
+            return False
+        
+        return True
+    
+    def run(self):
+        """Run the animation until it finishes.
+        
+        This is a standalone alternative to calling run_frame() in a loop.
+        The per-frame methods are bound to locals once, so each frame skips
+        the attribute lookups and the debug bookkeeping of run_frame().
+        """
+        if not self.is_running:
+            self.setup()
+        
+        update = self.update
+        render = self.render
+        throttle = self.throttle_frame_rate
+        is_finished = self.is_finished
+        
+        while True:
+            dt = throttle()
+            update(dt)
+            render()
+            if is_finished():
+                break
+        
+        self.cleanup()
 
 
-class TransitionAnimation(Animation):
+class TransitionAnimation(Animation, abstract=True):
     """Base class for transition animations with enhanced debugging.
     
     This class handles transitioning between two animations.
     """
     
+    __slots__ = (
+        'from_anim', 'to_anim', 'progress',
+        '_transition_duration', '_transition_duration_ns',
+    )
+    
     def __init__(self, display, config=None):
         """Initialize the transition.
         
@@ -221,47 +536,127 @@ class TransitionAnimation(Animation):
         self.from_anim = self.config.get('from_anim')
         self.to_anim = self.config.get('to_anim')
         self.progress = 0.0
+        self._transition_duration = self.config.get('duration', 1.0)
+        self._transition_duration_ns = int(self._transition_duration * 1e9)
         
         # Enhanced debug for transitions
-        if self.debug_level >= 1:
+        if self.debug_level >= 1 and logger.isEnabledFor(logging.DEBUG):
             from_name = self.from_anim.name if self.from_anim else "None"
             to_name = self.to_anim.name if self.to_anim else "None"
-            print(f"[DEBUG] Creating transition: {from_name} → {to_name}")
+            logger.debug("Creating transition: %s → %s", from_name, to_name)
         
     def is_finished(self):
         """Return True if the transition is complete."""
         return self.progress >= 1.0
 
 
+# Fade weights (out of 256) for progress 0..1 in 255 steps, eased with
+# 6t^5 - 15t^4 + 10t^3 so the fade starts and ends with zero velocity
+# and acceleration and has no visible kinks
+_FADE_WEIGHTS = tuple(
+    round(256 * t * t * t * (t * (t * 6 - 15) + 10))
+    for t in (i / 255 for i in range(256))
+)
+
+
+class _FadeLayer:
+    """One of the two animations blended by a fade transition.
+    
+    A layer renders its animation into its own frame buffer, reusing a
+    cached frame when the animation reports a state it has drawn before.
+    Whether there is an animation to render is decided when the layer is
+    built, so the per-frame update does not need to check for it.
+    """
+    
+    __slots__ = ('anim', 'frame', 'cache', 'cache_size')
+    
+    def __init__(self, anim, frame, cache_size):
+        self.anim = anim
+        self.frame = frame
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+    
+    def render(self, dt):
+        """Render the animation's next frame into self.frame."""
+        key = self.anim.state_hash()
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                self.frame[:] = cached
+                return
+        
+        self.anim.render_to_buffer(self.frame, dt)
+        if key is not None:
+            self.cache[key] = self.frame.copy()
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+
+class _EmptyLayer(_FadeLayer):
+    """Fade layer with no animation; its frame stays black."""
+    
+    __slots__ = ()
+    
+    def render(self, dt):
+        """Leave the black frame as it is."""
+
+
 class FadeTransition(TransitionAnimation):
     """Fade transition between two animations with enhanced debugging."""
     
+    # Number of rendered frames remembered per sub-animation
+    FRAME_CACHE_SIZE = 8
+    
+    __slots__ = ('_from_layer', '_to_layer', '_mix', '_weighted', '_frame')
+    
+    def __init__(self, display, config=None):
+        """Initialize the transition, its layers and blending buffers."""
+        super().__init__(display, config)
+        shape = (self.height, self.width, 3)
+        self._from_layer = self._make_layer(self.from_anim, shape)
+        self._to_layer = self._make_layer(self.to_anim, shape)
+        self._mix = np.empty(shape, dtype=np.uint16)
+        self._weighted = np.empty(shape, dtype=np.uint16)
+        self._frame = np.empty(shape, dtype=np.uint8)
+    
+    def _make_layer(self, anim, shape):
+        """Build the fade layer for an animation (which may be None)."""
+        frame = np.zeros(shape, dtype=np.uint8)
+        if anim is None:
+            return _EmptyLayer(None, frame, 0)
+        return _FadeLayer(anim, frame, self.FRAME_CACHE_SIZE)
+    
     def update(self, dt):
-        """Update the transition progress and render the blended frame."""
-        self.display.clear()
+        """Update the transition progress and draw the blended frame."""
+        # Once complete, leave the last frame on the display untouched
+        if self.progress >= 1.0:
+            return
         
-        # Update progress (0.0 to 1.0)
-        transition_duration = self.config.get('duration', 1.0)
-        old_progress = self.progress
-        self.progress = min(1.0, self.progress + dt / transition_duration)
+        # Update progress (0.0 to 1.0) from the frame timestamp, so it
+        # doesn't accumulate rounding error over the transition
+        elapsed_ns = self.last_frame_time_ns - self.start_time_ns
+        if elapsed_ns >= self._transition_duration_ns:
+            self.progress = 1.0
+        else:
+            self.progress = elapsed_ns / self._transition_duration_ns
         
         # Add transition-specific debug
-        if self.debug_level >= 2 and self.debug_count % self.debug_frequency == 0:
+        if (self._verbose and self._report_countdown == self._report_every
+                and logger.isEnabledFor(logging.DEBUG)):
             from_name = self.from_anim.name if self.from_anim else "None"
             to_name = self.to_anim.name if self.to_anim else "None"
-            print(f"[DEBUG] Fade transition: {from_name} → {to_name}, Progress: {self.progress:.2f}")
-        
-        # TODO: Implement frame blending for smoother transitions
-        # For now, just crossfade by showing one animation then the other
-        if self.progress < 0.5:
-            # First half of transition - show the from_anim
-            if self.from_anim:
-                # Track if we crossed the threshold
-                if old_progress < 0.5 <= self.progress and self.debug_level >= 1:
-                    print(f"[DEBUG] Transition halfway point: switching from {self.from_anim.name} to {self.to_anim.name}")
-                
-                self.from_anim.update(dt)
-        else:
-            # Second half of transition - show the to_anim
-            if self.to_anim:
-                self.to_anim.update(dt)
\ No newline at end of file
+            logger.debug(_FADE_FMT, from_name, to_name, self.progress)
+        
+        self._from_layer.render(dt)
+        self._to_layer.render(dt)
+        
+        # Blend in 8-bit fixed point, weighting to_anim by k/256
+        k = _FADE_WEIGHTS[int(self.progress * 255)]
+        mix = self._mix
+        np.multiply(self._from_layer.frame, 256 - k, out=mix, dtype=np.uint16)
+        np.multiply(self._to_layer.frame, k, out=self._weighted, dtype=np.uint16)
+        mix += self._weighted
+        mix >>= 8
+        self._frame[:] = mix
+        self.blit(self._frame)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Color tables for Unicorn HAT Mini animations.
+
+This module provides the fully saturated rainbow shared by the animations
+and the standalone scripts, so hues are converted to RGB by table lookup
+rather than through colorsys.
+"""
+
+import numpy as np
+
+
+def _hue_table():
+    """Build the fully saturated rainbow in fixed point.
+
+    The table has six hue sectors of 256 steps, in each of which one channel
+    ramps up or down.
+    """
+    up = np.arange(256, dtype=np.uint8)
+    down = 255 - up
+    full = np.full(256, 255, dtype=np.uint8)
+    zero = np.zeros(256, dtype=np.uint8)
+    sectors = [(full, up, zero), (down, full, zero), (zero, full, up),
+               (zero, down, full), (up, zero, full), (full, zero, down)]
+    return np.concatenate([np.stack(sector, axis=-1) for sector in sectors])
+
+
+# Fully saturated rainbow colors, indexed by int(hue * 1536) % 1536: as a
+# uint8 array of shape (1536, 3) for looking up many hues at once, and as
+# tuples for one at a time
+HUE_TABLE = _hue_table()
+HUE_COLORS = [tuple(rgb) for rgb in HUE_TABLE.tolist()]
@@ -8,182 +8,278 @@ This module contains several example animations implemented using the Animation
 import time
 import math
 import random
-import colorsys
 
-from animation import Animation, register_animation
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy code paths are used instead
+    njit = None
 
-@register_animation(name="rainbow")
+from animation import Animation, register_animation, register_animation_as, register_alias
+from animation.colors import HUE_TABLE, HUE_COLORS
+
+
+def _hue_to_rgb(hue):
+    """Look up fully saturated RGB colors for an array of hues (0.0-1.0).
+    
+    Returns a new uint8 array with a trailing axis of length 3.
+    """
+    return HUE_TABLE[(np.asarray(hue) * 1536).astype(np.intp) % 1536]
+
+
+def _polar_grid(width, height):
+    """Return (radius, angle) arrays of shape (height, width) about the center."""
+    dy, dx = np.mgrid[0:height, 0:width]
+    dx = dx - width // 2
+    dy = dy - height // 2
+    return np.hypot(dx, dy), np.arctan2(dy, dx)
+
+
+@register_animation_as("rainbow")
 class RainbowAnimation(Animation):
     """Rainbow animation that moves colors across the display."""
     
+    opaque = True
+    
+    def setup(self):
+        """Set up the rainbow animation."""
+        super().setup()
+        
+        # Hue offset of each pixel, based on its position
+        self._xy = (np.add.outer(np.arange(self.height), np.arange(self.width))
+                    / float(self.width + self.height))
+    
     def update(self, dt):
         """Update the rainbow animation."""
-        self.display.clear()
-        
         # Calculate animation time
-        t = time.time() - self.start_time
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate hue based on position and time
-                hue = (x + y) / float(self.width + self.height) + t * 0.2
-                hue = hue % 1.0
-                
-                # Convert HSV to RGB
-                r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-                
-                # Set the pixel
-                self.display.set_pixel(x, y, r, g, b)
-
-
-@register_animation(name="spiral")
+        t = time.monotonic() - self.start_time
+        
+        self.blit(_hue_to_rgb((self._xy + t * 0.2) % 1.0))
+
+
+@register_animation_as("spiral")
 class SpiralAnimation(Animation):
     """Spiral animation that draws spiraling patterns."""
     
-    def update(self, dt):
-        """Update the spiral animation."""
-        self.display.clear()
-        
-        # Calculate animation time
-        t = time.time() - self.start_time
+    opaque = True
+    
+    def setup(self):
+        """Set up the spiral animation."""
+        super().setup()
         
         # Define spiral parameters
-        max_radius = math.sqrt(self.width**2 + self.height**2) / 2
-        center_x, center_y = self.width // 2, self.height // 2
+        self.max_radius = math.sqrt(self.width**2 + self.height**2) / 2
         
         # Number of spiral arms
-        num_arms = self.config.get('num_arms', 2)
+        self.num_arms = self.config.get('num_arms', 2)
         
         # Rotation speed
-        rotation_speed = self.config.get('rotation_speed', 2.0)
-        
-        for x in range(self.width):
-            for y in range(self.height):
-                # Calculate polar coordinates
-                dx, dy = x - center_x, y - center_y
-                radius = math.sqrt(dx**2 + dy**2)
-                if radius == 0:
-                    radius = 0.001  # Avoid division by zero
-                
-                # Calculate angle in radians
-                angle = math.atan2(dy, dx)
-                
-                # Spiral function: r = a + bθ
-                # We want points where the radius is close to this function
-                spiral_angle = (angle + t * rotation_speed) % (2 * math.pi)
-                spiral_r = max_radius * spiral_angle / (2 * math.pi) * num_arms
-                
-                # Determine if this point is on the spiral
-                if abs(radius - spiral_r % max_radius) < 1.0:
-                    # Color based on angle
-                    hue = (spiral_angle / (2 * math.pi) + t / 2) % 1.0
-                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-                    self.display.set_pixel(x, y, r, g, b)
-
-
-@register_animation(name="rain")
+        self.rotation_speed = self.config.get('rotation_speed', 2.0)
+        
+        # Polar coordinates of every pixel, with the angle in turns (0.0-1.0)
+        self._radius, angle = _polar_grid(self.width, self.height)
+        self._radius[self._radius == 0] = 0.001  # Avoid division by zero
+        self._turns = angle / (2 * math.pi)
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+    
+    def update(self, dt):
+        """Update the spiral animation."""
+        # Calculate animation time
+        t = time.monotonic() - self.start_time
+        
+        # Spiral function: r = a + bθ
+        # We want points where the radius is close to this function
+        spiral_turns = (self._turns + t * self.rotation_speed / (2 * math.pi)) % 1.0
+        spiral_r = self.max_radius * self.num_arms * spiral_turns
+        on_spiral = np.abs(self._radius - spiral_r % self.max_radius) < 1.0
+        
+        # Color only the points on the spiral, based on angle
+        frame = self._frame
+        frame.fill(0)
+        frame[on_spiral] = _hue_to_rgb((spiral_turns[on_spiral] + t / 2) % 1.0)
+        self.blit(frame)
+
+
+@register_animation_as("rain")
 class RainAnimation(Animation):
     """Rain animation that simulates raindrops falling."""
     
+    opaque = True
+    
     def setup(self):
         """Set up the rain animation."""
         super().setup()
         print("Rain animation setup called!")
-        self.drops = []
         self.drop_rate = self.config.get('drop_rate', 2.0)  # Increased from 0.3
         self.drop_speed = self.config.get('drop_speed', 5.0)
         
+        # Drops are stored as parallel arrays of column, row and speed.
         # Add a debug drop in the middle of the screen
-        self.drops.append({'x': self.width // 2, 'y': 0, 'speed': 3.0})
+        self.drop_x = np.array([self.width // 2], dtype=np.intp)
+        self.drop_y = np.array([0.0])
+        self.drop_speeds = np.array([3.0])
         print(f"Added initial debug drop at ({self.width // 2}, 0)")
         
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        
     def update(self, dt):
         """Update the rain animation."""
-        self.display.clear()
-        
         # Debug info
-        if len(self.drops) == 0:
+        if len(self.drop_y) == 0:
             print(f"No drops yet. dt={dt}, drop_rate={self.drop_rate}, threshold={self.drop_rate * dt}")
         else:
-            print(f"Active drops: {len(self.drops)}")
+            print(f"Active drops: {len(self.drop_y)}")
         
         # Possibly create a new drop
         if random.random() < self.drop_rate * dt:
             x = random.randint(0, self.width - 1)
-            self.drops.append({'x': x, 'y': 0, 'speed': random.uniform(3.0, self.drop_speed)})
+            self.drop_x = np.append(self.drop_x, x)
+            self.drop_y = np.append(self.drop_y, 0.0)
+            self.drop_speeds = np.append(self.drop_speeds, random.uniform(3.0, self.drop_speed))
             print(f"Added new drop at ({x}, 0)")
         
-        # Update existing drops
-        new_drops = []
-        for drop in self.drops:
-            # Move the drop down
-            drop['y'] += drop['speed'] * dt
-            
-            # If the drop is still on screen, keep it
-            if drop['y'] < self.height:
-                new_drops.append(drop)
-                
-                # Draw the drop
-                y = int(drop['y'])
-                if 0 <= y < self.height:
-                    # Blue color with varying intensity
-                    intensity = 1.0 - (drop['y'] / self.height)
-                    r, g, b = 0, int(100 * intensity), int(255 * intensity)
-                    self.display.set_pixel(drop['x'], y, r, g, b)
-                    print(f"Drawing drop at ({drop['x']}, {y}) with color (0, {int(100 * intensity)}, {int(255 * intensity)})")
-        
-        self.drops = new_drops
-
-
-@register_animation(name="explosion")
+        # Move the drops down, keeping those still on screen
+        self.drop_y += self.drop_speeds * dt
+        on_screen = self.drop_y < self.height
+        if not on_screen.all():
+            self.drop_x = self.drop_x[on_screen]
+            self.drop_y = self.drop_y[on_screen]
+            self.drop_speeds = self.drop_speeds[on_screen]
+        
+        # Draw the drops, blue with varying intensity
+        frame = self._frame
+        frame.fill(0)
+        rows = self.drop_y.astype(np.intp)
+        intensity = 1.0 - (self.drop_y / self.height)
+        frame[rows, self.drop_x, 1] = (100 * intensity).astype(np.uint8)
+        frame[rows, self.drop_x, 2] = (255 * intensity).astype(np.uint8)
+        self.blit(frame)
+
+
+@register_animation_as("explosion")
 class ExplosionAnimation(Animation):
     """Explosion animation that radiates from the center."""
     
+    opaque = True
+    
+    def setup(self):
+        """Set up the explosion animation."""
+        super().setup()
+        
+        # Explosion parameters
+        self.max_radius = math.sqrt(self.width**2 + self.height**2) / 2
+        
+        # Distance from center and angle of every pixel
+        self._distance, self._angle = _polar_grid(self.width, self.height)
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        
+        # Random numbers for the spark roll, drawn for every pixel at once
+        self._rng = np.random.default_rng()
+        self._chance = np.empty((self.height, self.width))
+    
     def update(self, dt):
         """Update the explosion animation."""
-        self.display.clear()
-        
         # Calculate animation progress (0.0 to 1.0)
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         progress = min(1.0, elapsed / self.duration)
         
-        # Explosion parameters
-        center_x, center_y = self.width // 2, self.height // 2
-        max_radius = math.sqrt(self.width**2 + self.height**2) / 2
-        current_radius = progress * max_radius
+        current_radius = progress * self.max_radius
         ring_thickness = 2.0 * (1.0 - progress) + 0.5  # Ring gets thinner as it expands
         
-        for x in range(self.width):
-            for y in range(self.height):
-                # Calculate distance from center
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                
-                # Check if the pixel is within the expanding ring
-                if abs(distance - current_radius) < ring_thickness:
-                    # Color based on angle and progress (shifts from yellow/orange to red)
-                    angle = math.atan2(y - center_y, x - center_x)
-                    hue = (0.05 - 0.05 * progress) % 1.0  # Shift from yellow (0.15) to red (0.0)
-                    saturation = 1.0
-                    brightness = 1.0
-                    
-                    # Add some variation based on angle
-                    hue_variation = 0.05 * math.sin(angle * 5 + elapsed * 3)
-                    hue = (hue + hue_variation) % 1.0
-                    
-                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, saturation, brightness)]
-                    self.display.set_pixel(x, y, r, g, b)
-                
-                # Also draw some "sparks" in the center
-                elif distance < current_radius and random.random() < 0.05 * (1.0 - progress):
-                    r, g, b = 255, 255, 100
-                    self.display.set_pixel(x, y, r, g, b)
-
-
-@register_animation(name="forest-fire")
+        # Pixels within the expanding ring
+        ring = np.abs(self._distance - current_radius) < ring_thickness
+        
+        # Color based on angle and progress (shifts from yellow/orange to red),
+        # with some variation based on angle
+        hue = (0.05 - 0.05 * progress) % 1.0
+        hue_variation = 0.05 * np.sin(self._angle[ring] * 5 + elapsed * 3)
+        
+        frame = self._frame
+        frame.fill(0)
+        frame[ring] = _hue_to_rgb((hue + hue_variation) % 1.0)
+        
+        # Also draw some "sparks" in the center
+        self._rng.random(out=self._chance)
+        sparks = (~ring & (self._distance < current_radius)
+                  & (self._chance < 0.05 * (1.0 - progress)))
+        frame[sparks] = (255, 255, 100)
+        
+        self.blit(frame)
+
+
+# Forest fire cell states, used as indexes into the color palette
+_EMPTY, _TREE, _FIRE = 0, 1, 2
+
+
+def _step_fire_numpy(state, out, chance, p_tree, p_fire):
+    """Advance the forest fire grid one step, writing the result to out.
+    
+    chance holds a uniform random number in [0, 1) for each cell.
+    """
+    height, width = state.shape
+    fire = state == _FIRE
+    
+    # Mark cells with a fire anywhere in their 3x3 neighborhood, treating
+    # cells outside the grid as not burning
+    padded = np.zeros((height + 2, width + 2), dtype=bool)
+    padded[1:-1, 1:-1] = fire
+    near_fire = np.zeros_like(fire)
+    for dy in range(3):
+        for dx in range(3):
+            near_fire |= padded[dy:dy + height, dx:dx + width]
+    
+    # Fire dies out, empty space may grow a tree, and a tree may catch
+    # fire from neighbors or lightning
+    out[:] = state
+    out[fire] = _EMPTY
+    out[(state == _EMPTY) & (chance <= p_tree)] = _TREE
+    out[(state == _TREE) & (near_fire | (chance <= p_fire))] = _FIRE
+
+
+def _step_fire_loop(state, out, chance, p_tree, p_fire):
+    """Advance the forest fire grid one step, cell by cell (for Numba)."""
+    height, width = state.shape
+    for y in range(height):
+        for x in range(width):
+            cell = state[y, x]
+            if cell == _FIRE:
+                # Fire dies out
+                out[y, x] = _EMPTY
+            elif cell == _EMPTY:
+                # Empty space, may grow a tree
+                out[y, x] = _TREE if chance[y, x] <= p_tree else _EMPTY
+            else:
+                # Tree may catch fire from neighbors or lightning
+                burning = False
+                for ny in range(max(y - 1, 0), min(y + 2, height)):
+                    for nx in range(max(x - 1, 0), min(x + 2, width)):
+                        if state[ny, nx] == _FIRE:
+                            burning = True
+                if burning or chance[y, x] <= p_fire:
+                    out[y, x] = _FIRE
+                else:
+                    out[y, x] = _TREE
+
+
+_step_fire = _step_fire_numpy if njit is None else njit(cache=True)(_step_fire_loop)
+
+
+@register_animation_as("forest-fire")
 class ForestFireAnimation(Animation):
     """Forest fire cellular automaton animation."""
     
+    opaque = True
+    
+    def __init__(self, display, config=None):
+        """Initialize the forest fire animation."""
+        super().__init__(display, config)
+        
+        # Run one step up front, so that any JIT compilation of the step
+        # function happens now rather than during the first frame
+        grid = np.zeros((1, 1), dtype=np.uint8)
+        _step_fire(grid, np.empty_like(grid), np.zeros((1, 1)), 0.0, 0.0)
+    
     def setup(self):
         """Set up the forest fire animation."""
         super().setup()
@@ -197,76 +293,38 @@ class ForestFireAnimation(Animation):
         self.tree_color = (0, 255, 0)  # Green
         self.fire_color = (255, 0, 0)  # Red
         self.empty_color = (0, 0, 0)   # Black
-        
-        # Initialize grid
-        self.grid = {}
-        for x in range(self.width):
-            for y in range(self.height):
-                if random.random() <= self.initial_density:
-                    self.grid[(x, y)] = self.tree_color
-                else:
-                    self.grid[(x, y)] = self.empty_color
+        self.palette = np.array([self.empty_color, self.tree_color, self.fire_color],
+                                dtype=np.uint8)
+        
+        # Random numbers are drawn for every cell at once into this buffer
+        shape = (self.height, self.width)
+        self._rng = np.random.default_rng()
+        self._chance = np.empty(shape)
+        
+        # Initialize grid of cell states, indexed [y, x]
+        self.state = np.where(self._rng.random(shape) <= self.initial_density,
+                              _TREE, _EMPTY).astype(np.uint8)
+        self._next_state = np.empty_like(self.state)
     
     def update(self, dt):
         """Update the forest fire animation."""
-        # Neighborhood offsets for checking neighbors
-        neighborhood = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
-        
-        # Create a new grid to store the updated state
-        new_grid = {}
-        
-        # Update each cell based on the rules
-        for x in range(self.width):
-            for y in range(self.height):
-                cell = self.grid.get((x, y), self.empty_color)
-                
-                if cell == self.fire_color:
-                    # Fire dies out
-                    new_grid[(x, y)] = self.empty_color
-                    
-                elif cell == self.empty_color:
-                    # Empty space, may grow a tree
-                    if random.random() <= self.p_tree:
-                        new_grid[(x, y)] = self.tree_color
-                    else:
-                        new_grid[(x, y)] = self.empty_color
-                        
-                elif cell == self.tree_color:
-                    # Tree may catch fire from neighbors or lightning
-                    has_fire_neighbor = False
-                    
-                    # Check if any neighbors are on fire
-                    for dx, dy in neighborhood:
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.grid.get((nx, ny)) == self.fire_color:
-                                has_fire_neighbor = True
-                                break
-                    
-                    if has_fire_neighbor or random.random() <= self.p_fire:
-                        # Tree catches fire
-                        new_grid[(x, y)] = self.fire_color
-                    else:
-                        # Tree stays a tree
-                        new_grid[(x, y)] = self.tree_color
-        
-        # Update the grid
-        self.grid = new_grid
+        # Step into the spare buffer, then swap the two
+        new_state = self._next_state
+        self._rng.random(out=self._chance)
+        _step_fire(self.state, new_state, self._chance, self.p_tree, self.p_fire)
+        self._next_state = self.state
+        self.state = new_state
         
         # Draw the grid to the display
-        self.display.clear()
-        for (x, y), color in self.grid.items():
-            self.display.set_pixel(x, y, *color)
+        self.blit(self.palette[new_state])
 
 
-@register_animation(name="heart")
+@register_animation_as("heart")
 class PulsingHeart(Animation):
     """Displays a pulsing heart animation."""
     
+    opaque = True
+    
     def setup(self):
         """Set up the pulsing heart animation."""
         super().setup()
@@ -284,28 +342,44 @@ class PulsingHeart(Animation):
         ]
         
         self.pulse_rate = self.config.get('pulse_rate', 1.0)  # Pulses per second
-    
-    def update(self, dt):
-        """Update the heart animation."""
-        self.display.clear()
         
-        # Calculate the pulse (0.0 to 1.0)
-        t = time.time() - self.start_time
-        pulse = (math.sin(t * self.pulse_rate * 2 * math.pi - math.pi/2) + 1) / 2
+        # Coordinates of the heart pixels that fit on the display
+        visible = [(x, y) for x, y in self.heart_pixels
+                   if 0 <= x < self.width and 0 <= y < self.height]
+        self._heart_x = np.array([x for x, y in visible], dtype=np.intp)
+        self._heart_y = np.array([y for x, y in visible], dtype=np.intp)
         
-        # Color shifting from dark red to bright red
+        # RGB color for each of 256 pulse levels, shifting from dark red
+        # to bright red
         min_brightness = 0.3
-        brightness = min_brightness + (1.0 - min_brightness) * pulse
+        brightness = min_brightness + (1.0 - min_brightness) * np.arange(256) / 255
+        colors = (brightness[:, np.newaxis] * (255, 50, 50)).astype(int)
+        self._pulse_colors = [tuple(rgb) for rgb in colors.tolist()]
         
-        # Calculate RGB color for heart
-        r = int(255 * brightness)
-        g = int(50 * brightness)
-        b = int(50 * brightness)
+        # Everything but the heart stays black
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+    
+    def heart_color(self):
+        """Return the RGB color of the heart at the current time."""
+        # Calculate the pulse (0.0 to 1.0)
+        t = time.monotonic() - self.start_time
+        pulse = (math.sin(t * self.pulse_rate * 2 * math.pi - math.pi/2) + 1) / 2
         
+        return self._pulse_colors[int(pulse * 255)]
+    
+    def state_hash(self):
+        """The heart frame depends only on its color."""
+        return self.heart_color()
+    
+    def update(self, dt):
+        """Update the heart animation."""
         # Draw the heart
-        for x, y in self.heart_pixels:
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.display.set_pixel(x, y, r, g, b)
+        self._frame[self._heart_y, self._heart_x] = self.heart_color()
+        self.blit(self._frame)
+
+
+# The name the heart is given in config/animations.json
+register_alias("PulsingHeartAnimation", "heart")
 
 
 
@@ -314,6 +388,13 @@ class PulsingHeart(Animation):
 class DemoSequenceAnimation(Animation):
     """Demo sequence that cycles through multiple animation effects."""
     
+    opaque = True
+    
+    # Displays with at least this many pixels are rendered in tiles of
+    # TILE_SHAPE (rows, columns), to keep each tile's working set in cache
+    TILED_MIN_PIXELS = 2048
+    TILE_SHAPE = (8, 64)
+    
     def setup(self):
         """Set up the demo sequence."""
         super().setup()
@@ -326,20 +407,30 @@ class DemoSequenceAnimation(Animation):
             self.swirl_effect
         ]
         
-        # Generate a lookup table for 8-bit hue to RGB conversion
-        self.hue_to_rgb = []
-        for i in range(0, 360):
-            self.hue_to_rgb.append(colorsys.hsv_to_rgb(i / 359.0, 1, 1))
-        
         # Time for each effect
         self.effect_duration = self.config.get('effect_duration', 5.0)
+        
+        # Pixel coordinates, raw and relative to the center, as (height, width)
+        # arrays; each effect renders a whole frame from these at once
+        self._y, self._x = np.mgrid[0:self.height, 0:self.width].astype(float)
+        self._dx = self._x - self.width / 2
+        self._dy = self._y - self.height / 2
+        self._center_dist = np.sqrt(self._dx * self._dx + self._dy * self._dy)
+        
+        # Regions of the display to render at a time, as (rows, columns) slices
+        if self.width * self.height < self.TILED_MIN_PIXELS:
+            self._tiles = [(slice(None), slice(None))]
+        else:
+            tile_h, tile_w = self.TILE_SHAPE
+            self._tiles = [(slice(y, y + tile_h), slice(x, x + tile_w))
+                           for y in range(0, self.height, tile_h)
+                           for x in range(0, self.width, tile_w)]
+        self._frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
     
     def update(self, dt):
         """Update the demo sequence."""
-        self.display.clear()
-        
         # Calculate time and progress
-        t = time.time() - self.start_time
+        t = time.monotonic() - self.start_time
         f = t / self.effect_duration
         fx = int(f) % len(self.effects)
         next_fx = (fx + 1) % len(self.effects)
@@ -347,80 +438,58 @@ class DemoSequenceAnimation(Animation):
         # Calculate step for animation
         step = (t * 50)
         
-        # Update display using current effect and possibly blend with next effect
-        for y in range(self.height):
-            for x in range(self.width):
-                r, g, b = self.effects[fx](x, y, step)
-                
-                # Blend with next effect if we're in the transition period
-                if f % 1.0 > 0.75:
-                    r2, g2, b2 = self.effects[next_fx](x, y, step)
-                    ratio = (1.0 - (f % 1.0)) / 0.25
-                    r = r * ratio + r2 * (1.0 - ratio)
-                    g = g * ratio + g2 * (1.0 - ratio)
-                    b = b * ratio + b2 * (1.0 - ratio)
-                
-                # Clamp RGB values
-                r = int(max(0, min(255, r)))
-                g = int(max(0, min(255, g)))
-                b = int(max(0, min(255, b)))
-                
-                self.display.set_pixel(x, y, r, g, b)
-    
-    def tunnel_effect(self, x, y, step):
+        # Blend with next effect if we're in the transition period
+        blend = f % 1.0 > 0.75
+        ratio = (1.0 - (f % 1.0)) / 0.25
+        
+        # Render the current effect, tile by tile
+        frame = self._frame
+        for tile in self._tiles:
+            block = self.effects[fx](step, tile)
+            if blend:
+                block = block * ratio + self.effects[next_fx](step, tile) * (1.0 - ratio)
+            
+            # Clamp RGB values
+            frame[tile] = np.clip(block, 0, 255)
+        
+        self.blit(frame)
+    
+    def tunnel_effect(self, step, tile):
         """Zoom tunnel effect."""
         speed = step / 100.0
-        x -= (self.width / 2)
-        y -= (self.height / 2)
-        xo = math.sin(step / 27.0) * 2
-        yo = math.cos(step / 18.0) * 2
-        x += xo
-        y += yo
-        
-        if y == 0:
-            if x < 0:
-                angle = -(math.pi / 2)
-            else:
-                angle = (math.pi / 2)
-        else:
-            angle = math.atan(x / y)
-            
-        if y > 0:
-            angle += math.pi
-            
+        x = self._dx[tile] + math.sin(step / 27.0) * 2
+        y = self._dy[tile] + math.cos(step / 18.0) * 2
+        
+        # Angle about the tunnel center, in the range -pi/2...3pi/2
+        angle = (np.arctan2(-x, -y) + math.pi / 2) % (2 * math.pi) - math.pi / 2
+        
         angle /= 2 * math.pi  # convert angle to 0...1 range
-        hyp = math.sqrt(x*x + y*y)
-        shade = hyp / 2.1
-        shade = 1 if shade > 1 else shade
+        hyp = np.sqrt(x*x + y*y)
+        shade = np.minimum(hyp / 2.1, 1)
         angle += speed
         depth = speed + (hyp / 10)
         
-        col1 = self.hue_to_rgb[int(step) % 359]
-        col1 = (col1[0] * 0.8, col1[1] * 0.8, col1[2] * 0.8)
-        col2 = self.hue_to_rgb[int(step) % 359]
-        col2 = (col2[0] * 0.3, col2[1] * 0.3, col2[2] * 0.3)
-        col = col1 if int(abs(angle * 6.0)) % 2 == 0 else col2
-        td = .3 if int(abs(depth * 3.0)) % 2 == 0 else 0
-        col = (col[0] + td, col[1] + td, col[2] + td)
-        col = (col[0] * shade, col[1] * shade, col[2] * shade)
+        color = np.array(HUE_COLORS[int(step) % 359 * 1536 // 359], dtype=float)
+        level = np.where(np.abs(angle * 6.0).astype(int) % 2 == 0, 0.8, 0.3)
+        td = np.where(np.abs(depth * 3.0).astype(int) % 2 == 0, .3 * 255, 0)
         
-        return (col[0] * 255, col[1] * 255, col[2] * 255)
+        return (color * level[..., np.newaxis] + td[..., np.newaxis]) * shade[..., np.newaxis]
     
-    def rainbow_search_effect(self, x, y, step):
+    def rainbow_search_effect(self, step, tile):
         """Rainbow search spotlight effect."""
+        x, y = self._x[tile], self._y[tile]
         xs = math.sin(step / 100.0) * 20.0
         ys = math.cos(step / 100.0) * 20.0
         scale = ((math.sin(step / 60.0) + 1.0) / 5.0) + 0.2
-        r = math.sin((x + xs) * scale) + math.cos((y + xs) * scale)
-        g = math.sin((x + xs) * scale) + math.cos((y + ys) * scale)
-        b = math.sin((x + ys) * scale) + math.cos((y + ys) * scale)
+        r = np.sin((x + xs) * scale) + np.cos((y + xs) * scale)
+        g = np.sin((x + xs) * scale) + np.cos((y + ys) * scale)
+        b = np.sin((x + ys) * scale) + np.cos((y + ys) * scale)
         
-        return (r * 255, g * 255, b * 255)
+        return np.stack((r, g, b), axis=-1) * 255
     
-    def checker_effect(self, x, y, step):
+    def checker_effect(self, step, tile):
         """Roto-zooming checker board effect."""
-        x -= (self.width / 2)
-        y -= (self.height / 2)
+        x, y = self._dx[tile], self._dy[tile]
         angle = step / 10.0
         s = math.sin(angle)
         c = math.cos(angle)
@@ -431,25 +500,25 @@ class DemoSequenceAnimation(Animation):
         scale = (math.sin(step / 50.0) / 8.0) + 0.25
         xs *= scale
         ys *= scale
-        xo = abs(xs) - int(abs(xs))
-        yo = abs(ys) - int(abs(ys))
-        v = 0 if (math.floor(xs) + math.floor(ys)) % 2 else 1 if xo > .1 and yo > .1 else .5
-        r, g, b = self.hue_to_rgb[int(step) % 359]
+        xo = np.abs(xs) % 1.0
+        yo = np.abs(ys) % 1.0
+        v = np.where((np.floor(xs) + np.floor(ys)) % 2, 0,
+                     np.where((xo > .1) & (yo > .1), 1, .5))
+        color = np.array(HUE_COLORS[int(step) % 359 * 1536 // 359], dtype=float)
         
-        return (r * v * 255, g * v * 255, b * v * 255)
+        return color * v[..., np.newaxis]
     
-    def swirl_effect(self, x, y, step):
+    def swirl_effect(self, step, tile):
         """Twisty swirly goodness effect."""
-        x -= (self.width / 2)
-        y -= (self.height / 2)
-        dist = math.sqrt(x*x + y*y) / 2.0
+        x, y = self._dx[tile], self._dy[tile]
+        dist = self._center_dist[tile] / 2.0
         angle = (step / 10.0) + (dist * 1.5)
-        s = math.sin(angle)
-        c = math.cos(angle)
+        s = np.sin(angle)
+        c = np.cos(angle)
         xs = x * c - y * s
         ys = x * s + y * c
-        r = abs(xs + ys)
+        r = np.abs(xs + ys)
         r = r * 12.0
         r -= 20
         
-        return (r, r + (s * 130), r + (c * 130))
\ No newline at end of file
+        return np.stack((r, r + (s * 130), r + (c * 130)), axis=-1)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Font loading for Unicorn HAT Mini text rendering.
+
+This module provides a cached TrueType font loader, shared by the text
+animations and the standalone scripts.
+"""
+
+import functools
+
+from PIL import ImageFont
+
+
+@functools.lru_cache(maxsize=16)
+def load_font(path, size):
+    """Load a TrueType font, once for each path and size.
+
+    Errors are raised, and not cached, as by ImageFont.truetype().
+    """
+    return ImageFont.truetype(path, size)
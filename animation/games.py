@@ -8,7 +8,9 @@ This module contains interactive game animations.
 import time
 import math
 import random
-import colorsys
+import functools
+
+import numpy as np
 
 from animation import Animation, register_animation
 
@@ -20,15 +22,17 @@ from animation import Animation, register_animation
 class SnakeGameAnimation(Animation):
     """Interactive Snake game animation."""
     
+    opaque = True
+    
     def setup(self):
         """Set up the snake game."""
-        super().setup()
-        
-        # Mark as interactive
+        # Mark as interactive before the base setup reads the flag
         self.config['interactive'] = True
         
+        super().setup()
+        
         # Initialize snake
-        self.snake = [(self.width // 2, self.height // 2)]
+        self.reset_snake()
         self.direction = (1, 0)  # Right
         self.food = None
         self.place_food()
@@ -37,6 +41,9 @@ class SnakeGameAnimation(Animation):
         self.move_interval = self.config.get('move_interval', 0.2)  # seconds between moves
         self.last_move_time = self.start_time
         
+        # Frame buffer the snake and food are drawn into
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        
         # Register button handlers
         self.button_map = {
             self.display.BUTTON_A: (0, -1),  # Up
@@ -45,13 +52,27 @@ class SnakeGameAnimation(Animation):
             self.display.BUTTON_Y: (1, 0)    # Right
         }
     
+    def reset_snake(self):
+        """Reset the snake to a single segment in the middle of the display."""
+        self.snake = [(self.width // 2, self.height // 2)]
+        self._snake_set = set(self.snake)  # Same positions, for fast lookups
+    
     def place_food(self):
         """Place a food item at a random empty location."""
+        # Pick random positions until one is empty, while the board is
+        # mostly free; otherwise choose from the full list of empty cells
+        if len(self._snake_set) < self.width * self.height * 0.9:
+            while True:
+                pos = (random.randrange(self.width), random.randrange(self.height))
+                if pos not in self._snake_set:
+                    self.food = pos
+                    return
+        
         empty_positions = []
         for x in range(self.width):
             for y in range(self.height):
                 pos = (x, y)
-                if pos not in self.snake:
+                if pos not in self._snake_set:
                     empty_positions.append(pos)
         
         if empty_positions:
@@ -59,10 +80,8 @@ class SnakeGameAnimation(Animation):
     
     def update(self, dt):
         """Update the snake game."""
-        self.display.clear()
-        
         # Check if it's time to move the snake
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_move_time >= self.move_interval:
             self.last_move_time = current_time
             
@@ -74,13 +93,14 @@ class SnakeGameAnimation(Animation):
             new_head = ((head_x + dx) % self.width, (head_y + dy) % self.height)
             
             # Check if the snake hit itself
-            if new_head in self.snake:
+            if new_head in self._snake_set:
                 # Game over - reset snake
-                self.snake = [(self.width // 2, self.height // 2)]
+                self.reset_snake()
                 self.place_food()
             else:
                 # Add the new head
                 self.snake.insert(0, new_head)
+                self._snake_set.add(new_head)
                 
                 # Check if the snake ate the food
                 if new_head == self.food:
@@ -90,42 +110,55 @@ class SnakeGameAnimation(Animation):
                     # Check win condition (snake fills the screen)
                     if len(self.snake) >= self.width * self.height:
                         # Win! Reset the snake
-                        self.snake = [(self.width // 2, self.height // 2)]
+                        self.reset_snake()
                         self.place_food()
                 else:
                     # Remove the tail
-                    self.snake.pop()
+                    self._snake_set.discard(self.snake.pop())
         
-        # Draw the snake
-        for i, (x, y) in enumerate(self.snake):
-            if i == 0:
-                # Head is white
-                self.display.set_pixel(x, y, 255, 255, 255)
-            else:
-                # Body is green with varying brightness
-                brightness = 1.0 - (i / len(self.snake)) * 0.5
-                g = int(255 * brightness)
-                self.display.set_pixel(x, y, 0, g, 0)
+        frame = self._frame
+        frame.fill(0)
+        
+        # Draw the snake: body is green with varying brightness
+        length = len(self.snake)
+        xs, ys = np.array(self.snake, dtype=np.intp).T
+        brightness = 1.0 - (np.arange(length) / length) * 0.5
+        frame[ys, xs, 1] = (255 * brightness).astype(np.uint8)
+        
+        # Head is white
+        frame[ys[0], xs[0]] = (255, 255, 255)
         
         # Draw the food (red)
         if self.food:
             # Make food pulsate
-            pulse = (math.sin(time.time() * 5) + 1) / 2
+            pulse = (math.sin(current_time * 5) + 1) / 2
             r = 150 + int(105 * pulse)
-            self.display.set_pixel(self.food[0], self.food[1], r, 0, 0)
+            frame[self.food[1], self.food[0]] = (r, 0, 0)
+        
+        self.blit(frame)
+    
+    def turn(self, new_dir):
+        """Change the snake direction, unless it would reverse the snake."""
+        # Don't allow 180 degree turns
+        dx, dy = self.direction
+        new_dx, new_dy = new_dir
+        
+        if not (dx == -new_dx and dy == -new_dy):
+            self.direction = new_dir
+            return True
+        
+        return False
     
     def handle_button_press(self, button):
         """Handle button presses to change snake direction."""
         if button in self.button_map:
-            # Get the new direction
-            new_dir = self.button_map[button]
-            
-            # Don't allow 180 degree turns
-            dx, dy = self.direction
-            new_dx, new_dy = new_dir
-            
-            if not (dx == -new_dx and dy == -new_dy):
-                self.direction = new_dir
-                return True
+            return self.turn(self.button_map[button])
         
         return False
+    
+    def get_button_handlers(self):
+        """Return a handler for each direction button."""
+        return {
+            button: functools.partial(self.turn, new_dir)
+            for button, new_dir in self.button_map.items()
+        }
@@ -11,34 +11,65 @@ import inspect
 import os
 import sys
 
+from .base import Animation
+
 # Dictionary to store all registered animations
 _ANIMATIONS = {}
 
+# Other names animations can be looked up by, mapped to the name they are
+# registered under. Aliases are not listed by get_animation_names().
+_ALIASES = {}
+
+# Classes already registered by discover_animations(), so that a class
+# imported into several modules is only registered once
+_DISCOVERED = set()
+
+# Names of modules already scanned by discover_animations()
+_SCANNED_MODULES = set()
 
-def register_animation(cls=None, name=None):
-    """Register an animation class.
+
+def register_animation(cls):
+    """Register an animation class under its class name.
     
-    This function can be used as a decorator or called directly.
+    Use as a plain decorator (``@register_animation``) or call directly.
     
     Args:
         cls: The animation class to register
-        name: Optional name to register the animation under
-            If not provided, the class name will be used
     
     Returns:
         The registered class (for decorator usage)
     """
+    _ANIMATIONS[cls.__name__] = cls
+    return cls
+
+
+def register_animation_as(name):
+    """Create a decorator that registers an animation class under a name.
+    
+    Args:
+        name: The name to register the animation under
+    
+    Returns:
+        A decorator that registers the class and returns it unchanged
+    """
     def _register(cls):
-        animation_name = name or cls.__name__
-        _ANIMATIONS[animation_name] = cls
+        _ANIMATIONS[name] = cls
         return cls
-        
-    if cls is None:
-        # Called as @register_animation(name="example")
-        return _register
-    else:
-        # Called as @register_animation
-        return _register(cls)
+    return _register
+
+
+def register_alias(alias, name):
+    """Make a registered animation available under another name as well.
+    
+    The alias can be used wherever an animation name is looked up, but is
+    not listed by get_animation_names(), so the animation still appears
+    only once.
+    
+    Args:
+        alias: The other name
+        name: The name the animation is registered under
+    """
+    _ALIASES[alias] = name
 
 
 def get_animation_class(name):
@@ -50,11 +81,14 @@ def get_animation_class(name):
     Returns:
         The animation class, or None if not found
     """
-    return _ANIMATIONS.get(name)
+    cls = _ANIMATIONS.get(name)
+    if cls is None and name in _ALIASES:
+        cls = _ANIMATIONS.get(_ALIASES[name])
+    return cls
 
 
 def get_animation_names():
-    """Get a list of all registered animation names.
+    """Get a list of all registered animation names, without aliases.
     
     Returns:
         List of animation names
@@ -102,14 +136,26 @@ def discover_animations(package):
         if is_pkg:
             # Recurse into subpackages
             discover_animations(module_name)
-        else:
+        elif module_name not in _SCANNED_MODULES:
+            _SCANNED_MODULES.add(module_name)
+            
             # Import the module
             module = importlib.import_module(module_name)
             
-            # Find and register all Animation subclasses in the module
-            from .base import Animation
-            for name, obj in inspect.getmembers(module):
+            # Find and register all Animation subclasses defined in the
+            # module, skipping anything it merely imports
+            for obj in list(vars(module).values()):
                 if (inspect.isclass(obj) and 
+                    obj.__module__ == module_name and
                     issubclass(obj, Animation) and 
-                    obj != Animation):
-                    register_animation(obj)
\ No newline at end of file
+                    obj is not Animation and
+                    obj not in _DISCOVERED):
+                    _DISCOVERED.add(obj)
+                    
+                    # A class already registered under another name gets
+                    # its class name as an alias, not a second listing
+                    registered = next((n for n, c in _ANIMATIONS.items() if c is obj), None)
+                    if registered is None:
+                        register_animation(obj)
+                    elif registered != obj.__name__:
+                        register_alias(obj.__name__, registered)
\ No newline at end of file
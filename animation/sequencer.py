@@ -1,30 +1,162 @@
 #!/usr/bin/env python3
 """
-Animation Sequencer with Enhanced Debugging for Unicorn HAT Mini.
+Animation Sequencer for Unicorn HAT Mini.
 
-This file provides an enhanced version of the AnimationSequencer class
-with improved debugging output. To use this, replace or modify your
-existing animation/sequencer.py with this content.
+This module provides the AnimationSequencer class, which plays a sequence
+of animations with transitions between them. Debug output goes to the
+animation.sequencer logger and is controlled by the debug level.
 """
 
+import os
+import copy
 import time
 import json
 import random
+import logging
+import threading
+import functools
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_mode = 'rb'
+except ImportError:  # orjson is optional and only parses faster than json
+    _json_loads = json.loads
+    _json_mode = 'r'
+
+from .base import FadeTransition
+from .registry import get_animation_names, create_animation
+from .timing import FrameTimer
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_cached(path, mtime):
+    """Parse a JSON config file, reusing the result while it is unchanged.
+
+    The modification time is part of the cache key, so an edited file is
+    parsed again. Callers must copy the result before modifying it.
+    """
+    with open(path, _json_mode) as f:
+        return _json_loads(f.read())
+
+
+class _FrameView:
+    """Display view whose pixel buffer is a fixed frame.
+    
+    Lets the display's own show() run against a finished frame while new
+    frames are drawn into the display's live buffer.
+    """
+    
+    __slots__ = ('display', 'disp')
+    
+    def __init__(self, display, disp):
+        object.__setattr__(self, 'display', display)
+        object.__setattr__(self, 'disp', disp)
+    
+    def __getattr__(self, name):
+        return getattr(self.display, name)
+    
+    def __setattr__(self, name, value):
+        setattr(self.display, name, value)
+
+
+def _show_target(display):
+    """Return the display whose show() writes its own pixel buffer."""
+    return getattr(display, 'unicorn', display)
+
+
+class _AsyncShowDisplay:
+    """Display wrapper that sends frames to the hardware on a worker thread.
+    
+    show() hands the finished pixel buffer to the worker and gives the
+    display a copy to keep drawing into, so the next frame is rendered
+    while the previous one is written over SPI. If the worker is still busy
+    when another frame arrives, the older unsent frame is dropped. Anything
+    other than show() is passed through to the real display.
+    
+    A wrapper display such as unicornhatutils.UnicornHATMini, which keeps
+    the library display in its 'unicorn' attribute, has its frames sent by
+    that inner display.
+    """
+    
+    __slots__ = ('display', '_target', '_show', '_pending', '_busy', '_ready')
+    
+    def __init__(self, display):
+        self.display = display
+        self._target = _show_target(display)
+        self._show = type(self._target).show
+        self._pending = None  # Latest frame not yet picked up by the worker
+        self._busy = False
+        self._ready = threading.Condition()
+        threading.Thread(target=self._run, name="display-show", daemon=True).start()
+    
+    def show(self):
+        display = self._target
+        frame = display.disp
+        display.disp = frame.copy()
+        with self._ready:
+            self._pending = frame
+            self._ready.notify_all()
+    
+    def flush(self):
+        """Wait until the last frame passed to show() has been sent."""
+        with self._ready:
+            while self._pending is not None or self._busy:
+                self._ready.wait()
+    
+    def _run(self):
+        ready = self._ready
+        while True:
+            with ready:
+                while self._pending is None:
+                    ready.wait()
+                frame, self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._show(_FrameView(self._target, frame))
+            except Exception as e:
+                print(f"[SEQUENCER] Error showing frame: {e}")
+            finally:
+                with ready:
+                    self._busy = False
+                    ready.notify_all()
+    
+    def __getattr__(self, name):
+        return getattr(self.display, name)
 
 
 class AnimationSequencer:
-    """Manages a sequence of animations with transitions and enhanced debugging."""
+    """Manages a sequence of animations with transitions."""
+    
+    # Transition classes by the name used in the 'transition' config option
+    _TRANSITIONS = {'fade': FadeTransition}
     
-    def __init__(self, display, config_file=None, debug_level=1):
+    __slots__ = (
+        'display', 'config', 'animations', 'current_index',
+        'current_animation', 'next_animation', 'transition',
+        'is_transitioning', 'is_running', 'is_paused',
+        'button_handlers', 'debug_level', 'sequence_start_time', 'frame_count',
+        '_debug_enabled', '_verbose', '_order', '_button_dispatch',
+        '_blink_counter', '_blink_period',
+        '_transition_type', '_transition_duration', '_transition_class',
+        '_transition_config',
+    )
+    
+    def __init__(self, display, config_file=None, debug_level=1, async_show=None):
         """Initialize the animation sequencer.
         
         Args:
             display: The UnicornHATMini display
             config_file: Optional path to a configuration file
             debug_level: Debug verbosity level (0=none, 1=basic, 2=verbose)
+            async_show: Whether to write frames to the display on a background
+                thread; None uses the 'async_show' config option
         """
         self.display = display
         self.animations = []
+        self._order = []  # Play order, as indexes into self.animations
         self.current_index = 0
         self.current_animation = None
         self.next_animation = None
@@ -33,22 +165,59 @@ class AnimationSequencer:
         self.is_running = False
         self.is_paused = False
         self.button_handlers = {}
+        self._button_dispatch = {}  # Button -> handler, see _rebuild_button_dispatch()
         self.debug_level = debug_level
+        self._debug_enabled = debug_level >= 1
+        self._verbose = debug_level >= 2
         self.sequence_start_time = None
         self.frame_count = 0
         
+        # Paused-state blink, counted in update() calls rather than clock
+        # time; at ~60 updates per second a period of 30 is about 0.5s
+        self._blink_counter = 0
+        self._blink_period = 30
+        
         # Debug initialization
-        if self.debug_level >= 1:
-            print(f"\n[SEQUENCER] Initializing animation sequencer")
-            print(f"[SEQUENCER] Debug level: {self.debug_level}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Initializing animation sequencer")
+            logger.debug("[SEQUENCER] Debug level: %s", self.debug_level)
         
         # Load configuration
         self.config = self._load_config(config_file)
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Configuration loaded")
-            if self.debug_level >= 2:
-                print(f"[SEQUENCER] Config: {self.config}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Configuration loaded")
+            if self._verbose:
+                logger.debug("[SEQUENCER] Config: %s", self.config)
+        
+        # Optionally write frames to the display on a background thread.
+        # The display's show() must only read its buffer and talk to the
+        # hardware, as the real UnicornHATMini does; the pygame proxy also
+        # handles window events there, so it should keep this off.
+        if async_show is None:
+            async_show = self.config.get('async_show', False)
+        if async_show:
+            if callable(getattr(type(_show_target(display)), 'show', None)):
+                self.display = _AsyncShowDisplay(display)
+            else:
+                logger.warning("[SEQUENCER] %s has no show() to run on a worker thread; "
+                               "showing frames synchronously", type(display).__name__)
+        
+        # Resolve the transition settings once. Transitions copy what they
+        # need from their config in __init__, so one dict is reused for all
+        # of them with only the animations replaced.
+        self._transition_type = self.config.get('transition', 'fade')
+        self._transition_duration = self.config.get('transition_duration', 1.0)
+        self._transition_class = self._TRANSITIONS.get(self._transition_type)
+        if self._transition_class is None:
+            print(f"[SEQUENCER] Warning: Unsupported transition type '{self._transition_type}', falling back to fade")
+            self._transition_class = FadeTransition
+        self._transition_config = {
+            'from_anim': None,
+            'to_anim': None,
+            'duration': self._transition_duration,
+            'debug_level': self.debug_level
+        }
         
         self._init_animations()
         
@@ -68,38 +237,38 @@ class AnimationSequencer:
             'loop': True,
             'shuffle': False,
             'default_duration': 5.0,
+            'target_fps': 60,
+            'async_show': False,
             'debug_level': self.debug_level
         }
         
         if config_file:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Loading config from: {config_file}")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Loading config from: %s", config_file)
                 
             try:
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
-                default_config.update(user_config)
+                mtime = os.stat(config_file).st_mtime
+                user_config = _parse_config_cached(config_file, mtime)
+                default_config.update(copy.deepcopy(user_config))
                 
-                if self.debug_level >= 1:
-                    print(f"[SEQUENCER] Config loaded successfully")
-            except (IOError, json.JSONDecodeError) as e:
+                if self._debug_enabled:
+                    logger.debug("[SEQUENCER] Config loaded successfully")
+            except (IOError, ValueError) as e:
                 print(f"[SEQUENCER] Error loading config file: {e}")
         else:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] No config file specified, using defaults")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] No config file specified, using defaults")
         
         return default_config
     
     def _init_animations(self):
         """Initialize animations from config."""
-        from .registry import get_animation_names, create_animation
-        
         animation_configs = self.config.get('animations', [])
         
         if not animation_configs:
             # If no animations in config, use all available animations
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] No animations specified in config, using all available")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] No animations specified in config, using all available")
                 
             for name in get_animation_names():
                 animation_configs.append({
@@ -109,8 +278,8 @@ class AnimationSequencer:
                 })
         
         # Create animation objects
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Creating {len(animation_configs)} animations:")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Creating %s animations:", len(animation_configs))
             
         for anim_config in animation_configs:
             name = anim_config.get('name')
@@ -122,25 +291,32 @@ class AnimationSequencer:
                 anim = create_animation(name, self.display, anim_config)
                 if anim:
                     self.animations.append(anim)
-                    if self.debug_level >= 1:
-                        print(f"[SEQUENCER]   - {name} (duration: {anim_config.get('duration', self.config.get('default_duration'))}s)")
+                    if self._debug_enabled:
+                        logger.debug("[SEQUENCER]   - %s (duration: %ss)", name, anim_config.get('duration', self.config.get('default_duration')))
                 else:
                     print(f"[SEQUENCER] Warning: Failed to create animation '{name}'")
         
+        # Shuffle the play order, leaving the animations list itself alone
+        self._order = list(range(len(self.animations)))
         if self.config.get('shuffle', False):
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Shuffling animations")
-            random.shuffle(self.animations)
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Shuffling animations")
+            random.shuffle(self._order)
         
         # Initialize the first animation
         if self.animations:
-            self.current_animation = self.animations[0]
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Initial animation: {self.current_animation.name}")
+            self.current_animation = self._animation_at(0)
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Initial animation: %s", self.current_animation.name)
             self.current_animation.setup()
+            self._rebuild_button_dispatch()
         else:
             print(f"[SEQUENCER] Warning: No animations available to play!")
     
+    def _animation_at(self, index):
+        """Return the animation at a position in the play order."""
+        return self.animations[self._order[index]]
+    
     def _create_transition(self, from_anim, to_anim):
         """Create a transition animation between two animations.
         
@@ -151,66 +327,53 @@ class AnimationSequencer:
         Returns:
             A transition animation
         """
-        from .registry import create_animation
-        
-        transition_type = self.config.get('transition', 'fade')
-        transition_duration = self.config.get('transition_duration', 1.0)
-        
-        if self.debug_level >= 1:
+        if self._debug_enabled:
             from_name = from_anim.name if from_anim else "None"
             to_name = to_anim.name if to_anim else "None"
-            print(f"[SEQUENCER] Creating {transition_type} transition: {from_name} → {to_name} ({transition_duration}s)")
+            logger.debug("[SEQUENCER] Creating %s transition: %s → %s (%ss)", self._transition_type, from_name, to_name, self._transition_duration)
         
-        transition_config = {
-            'from_anim': from_anim,
-            'to_anim': to_anim,
-            'duration': transition_duration,
-            'debug_level': self.debug_level
-        }
-        
-        # Use the animation registry to create the transition
-        if transition_type == 'fade':
-            from .sequencer import FadeTransition
-            return FadeTransition(self.display, transition_config)
-        else:
-            print(f"[SEQUENCER] Warning: Unsupported transition type '{transition_type}', falling back to fade")
-            from .sequencer import FadeTransition
-            return FadeTransition(self.display, transition_config)
+        transition_config = self._transition_config
+        transition_config['from_anim'] = from_anim
+        transition_config['to_anim'] = to_anim
+        return self._transition_class(self.display, transition_config)
     
     def next(self):
         """Advance to the next animation."""
         if not self.animations:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] No animations available, cannot advance")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] No animations available, cannot advance")
             return
             
         # If we're already transitioning, do nothing
         if self.is_transitioning:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Already transitioning, ignoring next() call")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Already transitioning, ignoring next() call")
             return
             
-        # Determine the next animation
-        next_index = (self.current_index + 1) % len(self.animations)
+        # Determine the next animation, wrapping around at the end
+        next_index = self.current_index + 1
+        if next_index == len(self.animations):
+            next_index = 0
         
         # If we've reached the end and not looping, stop
         if next_index == 0 and not self.config.get('loop', True):
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Reached end of sequence and loop=False, stopping")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Reached end of sequence and loop=False, stopping")
             self.current_animation.cleanup()
             self.current_animation = None
+            self._rebuild_button_dispatch()
             self.is_running = False
             return
             
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Advancing to next animation: {self.current_index} → {next_index}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Advancing to next animation: %s → %s", self.current_index, next_index)
             
         self.current_index = next_index
-        self.next_animation = self.animations[next_index]
+        self.next_animation = self._animation_at(next_index)
         self.next_animation.setup()
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Next animation: {self.next_animation.name}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Next animation: %s", self.next_animation.name)
         
         # Create transition
         self.transition = self._create_transition(
@@ -223,28 +386,30 @@ class AnimationSequencer:
     def previous(self):
         """Go back to the previous animation."""
         if not self.animations:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] No animations available, cannot go back")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] No animations available, cannot go back")
             return
             
         # If we're already transitioning, do nothing
         if self.is_transitioning:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Already transitioning, ignoring previous() call")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Already transitioning, ignoring previous() call")
             return
             
-        # Determine the previous animation
-        prev_index = (self.current_index - 1) % len(self.animations)
+        # Determine the previous animation, wrapping around at the start
+        prev_index = self.current_index - 1
+        if prev_index < 0:
+            prev_index = len(self.animations) - 1
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Going to previous animation: {self.current_index} → {prev_index}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Going to previous animation: %s → %s", self.current_index, prev_index)
             
         self.current_index = prev_index
-        self.next_animation = self.animations[prev_index]
+        self.next_animation = self._animation_at(prev_index)
         self.next_animation.setup()
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Previous animation: {self.next_animation.name}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Previous animation: %s", self.next_animation.name)
         
         # Create transition
         self.transition = self._create_transition(
@@ -255,27 +420,27 @@ class AnimationSequencer:
         self.is_transitioning = True
     
     def jump_to(self, index):
-        """Jump to a specific animation by index."""
+        """Jump to a specific animation by its index in self.animations."""
         if not self.animations or index < 0 or index >= len(self.animations):
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Invalid animation index: {index}")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Invalid animation index: %s", index)
             return
             
         # If we're already transitioning, do nothing
         if self.is_transitioning:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Already transitioning, ignoring jump_to({index}) call")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Already transitioning, ignoring jump_to(%s) call", index)
             return
             
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Jumping to animation index {index}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Jumping to animation index %s", index)
             
-        self.current_index = index
+        self.current_index = self._order.index(index)
         self.next_animation = self.animations[index]
         self.next_animation.setup()
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Target animation: {self.next_animation.name}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Target animation: %s", self.next_animation.name)
         
         # Create transition
         self.transition = self._create_transition(
@@ -294,25 +459,15 @@ class AnimationSequencer:
         Returns:
             bool: True if the button press was handled, False otherwise
         """
-        if self.debug_level >= 2:
-            print(f"[SEQUENCER] Button press: {button}")
-            
-        # First, check if the current animation handles this button
-        if self.current_animation and self.current_animation.handle_button_press(button):
-            if self.debug_level >= 2:
-                print(f"[SEQUENCER] Button {button} handled by animation: {self.current_animation.name}")
-            return True
+        if self._verbose:
+            logger.debug("[SEQUENCER] Button press: %s", button)
             
-        # Then check if we have a handler for this button
-        handler = self.button_handlers.get(button)
-        if handler:
-            if self.debug_level >= 2:
-                print(f"[SEQUENCER] Button {button} handled by registered handler")
-            handler()
+        handler = self._button_dispatch.get(button)
+        if handler is not None and handler():
             return True
             
-        if self.debug_level >= 2:
-            print(f"[SEQUENCER] Button {button} not handled")
+        if self._verbose:
+            logger.debug("[SEQUENCER] Button %s not handled", button)
             
         return False
     
@@ -324,8 +479,47 @@ class AnimationSequencer:
             handler: Function to call when the button is pressed
         """
         self.button_handlers[button] = handler
-        if self.debug_level >= 2:
-            print(f"[SEQUENCER] Registered handler for button {button}")
+        self._rebuild_button_dispatch()
+        if self._verbose:
+            logger.debug("[SEQUENCER] Registered handler for button %s", button)
+    
+    def _rebuild_button_dispatch(self):
+        """Rebuild the button dispatch table for the current animation.
+        
+        Each entry takes no arguments and returns True if it handled the
+        press. The current animation gets the first chance at a button;
+        if it declines, the registered handler for that button runs.
+        """
+        verbose = self._verbose
+        
+        def registered(button, handler):
+            def handle():
+                if verbose:
+                    logger.debug("[SEQUENCER] Button %s handled by registered handler", button)
+                handler()
+                return True
+            return handle
+        
+        def animation_first(button, name, handler, fallback):
+            def handle():
+                if handler():
+                    if verbose:
+                        logger.debug("[SEQUENCER] Button %s handled by animation: %s", button, name)
+                    return True
+                return fallback() if fallback is not None else False
+            return handle
+        
+        dispatch = {
+            button: registered(button, handler)
+            for button, handler in self.button_handlers.items()
+        }
+        
+        anim = self.current_animation
+        if anim:
+            for button, handler in anim.get_button_handlers().items():
+                dispatch[button] = animation_first(button, anim.name, handler, dispatch.get(button))
+        
+        self._button_dispatch = dispatch
     
     def start(self):
         """Start the animation sequence."""
@@ -335,19 +529,20 @@ class AnimationSequencer:
             
         self.is_running = True
         self.is_paused = False
-        self.sequence_start_time = time.time()
+        self.sequence_start_time = time.monotonic()
         self.frame_count = 0
         
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Starting animation sequence")
-            if self.debug_level >= 2:
-                print(f"[SEQUENCER] Start time: {time.strftime('%H:%M:%S')}")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Starting animation sequence")
+            if self._verbose:
+                logger.debug("[SEQUENCER] Start time: %s", time.strftime('%H:%M:%S'))
         
         if not self.current_animation:
-            self.current_animation = self.animations[0]
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Initial animation: {self.current_animation.name}")
+            self.current_animation = self._animation_at(0)
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Initial animation: %s", self.current_animation.name)
             self.current_animation.setup()
+            self._rebuild_button_dispatch()
     
     def stop(self):
         """Stop the animation sequence."""
@@ -356,31 +551,44 @@ class AnimationSequencer:
             
         self.is_running = False
         
-        if self.debug_level >= 1:
-            elapsed = time.time() - self.sequence_start_time if self.sequence_start_time else 0
-            print(f"[SEQUENCER] Stopping animation sequence after {elapsed:.2f}s, {self.frame_count} frames")
+        if self._debug_enabled:
+            elapsed = time.monotonic() - self.sequence_start_time if self.sequence_start_time else 0
+            logger.debug("[SEQUENCER] Stopping animation sequence after %.2fs, %s frames", elapsed, self.frame_count)
         
         if self.current_animation:
             self.current_animation.cleanup()
             self.current_animation = None
+            self._rebuild_button_dispatch()
             
         if self.transition:
             self.transition.cleanup()
             self.transition = None
             
         self.is_transitioning = False
+        
+        # Wait for the last frame to reach the display
+        if isinstance(self.display, _AsyncShowDisplay):
+            self.display.flush()
     
     def pause(self):
         """Pause the animation sequence."""
         self.is_paused = True
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Paused animation sequence")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Paused animation sequence")
     
     def resume(self):
         """Resume the animation sequence."""
         self.is_paused = False
-        if self.debug_level >= 1:
-            print(f"[SEQUENCER] Resumed animation sequence")
+        if self._debug_enabled:
+            logger.debug("[SEQUENCER] Resumed animation sequence")
+    
+    def _log_status(self):
+        """Log the current animation, frame count and frame rate."""
+        elapsed = time.monotonic() - self.sequence_start_time if self.sequence_start_time else 0
+        current_name = self.current_animation.name if self.current_animation else "None"
+        fps = self.frame_count / elapsed if elapsed > 0 else 0
+        
+        logger.debug("[SEQUENCER] Status: current=%s, frame=%s, fps=%.1f", current_name, self.frame_count, fps)
     
     def update(self):
         """Update the current animation or transition.
@@ -393,57 +601,60 @@ class AnimationSequencer:
             
         if self.is_paused:
             # Blink the first pixel slowly to indicate paused state
-            if int(time.time() * 2) % 2 == 0:
-                self.display.set_pixel(0, 0, 255, 0, 0)
-            else:
-                self.display.set_pixel(0, 0, 0, 0, 0)
+            self._blink_counter += 1
+            on = (self._blink_counter // (self._blink_period // 2)) & 1
+            self.display.set_pixel(0, 0, 255 * on, 0, 0)
             self.display.show()
             return self.is_running
             
         # Increment frame counter
-        self.frame_count += 1
+        frame_count = self.frame_count + 1
+        self.frame_count = frame_count
+        
+        # Periodically log sequence status (every 128 frames)
+        debug_enabled = self._debug_enabled
+        if debug_enabled and (frame_count & 127) == 0:
+            self._log_status()
+        
+        # Work on locals; self is only written when the state changes
+        current = self.current_animation
         
-        # Periodically print sequence status
-        if self.debug_level >= 1 and self.frame_count % 100 == 0:
-            elapsed = time.time() - self.sequence_start_time if self.sequence_start_time else 0
-            current_name = self.current_animation.name if self.current_animation else "None"
-            fps = self.frame_count / elapsed if elapsed > 0 else 0
-            
-            print(f"[SEQUENCER] Status: current={current_name}, frame={self.frame_count}, fps={fps:.1f}")
-            
         if self.is_transitioning:
             # Update the transition
-            if self.transition.run_frame():
+            transition = self.transition
+            if transition.run_frame():
                 # Transition still in progress
                 return True
                 
             # Transition finished, switch to next animation
-            if self.debug_level >= 1:
-                from_name = self.current_animation.name if self.current_animation else "None"
-                to_name = self.next_animation.name if self.next_animation else "None"
-                print(f"[SEQUENCER] Transition complete: {from_name} → {to_name}")
+            next_animation = self.next_animation
+            if debug_enabled:
+                from_name = current.name if current else "None"
+                to_name = next_animation.name if next_animation else "None"
+                logger.debug("[SEQUENCER] Transition complete: %s → %s", from_name, to_name)
                 
-            self.transition.cleanup()
+            transition.cleanup()
             self.transition = None
             self.is_transitioning = False
             
-            if self.current_animation:
-                self.current_animation.cleanup()
+            if current:
+                current.cleanup()
                 
-            self.current_animation = self.next_animation
+            self.current_animation = next_animation
             self.next_animation = None
+            self._rebuild_button_dispatch()
             
             return True
         
-        elif self.current_animation:
+        elif current:
             # Update the current animation
-            if self.current_animation.run_frame():
+            if current.run_frame():
                 # Animation still running
                 return True
                 
             # Animation finished, move to next
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Animation finished: {self.current_animation.name}, advancing to next")
+            if debug_enabled:
+                logger.debug("[SEQUENCER] Animation finished: %s, advancing to next", current.name)
                 
             self.next()
             return True
@@ -454,17 +665,30 @@ class AnimationSequencer:
         """Run the animation sequence until stopped."""
         self.start()
         
+        timer = None
         try:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Entering main loop")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Entering main loop")
                 
-            while self.update():
-                # Process display events if available
-                if hasattr(self.display, 'process_events'):
-                    self.display.process_events()
+            # Look up the per-frame calls once; displays without
+            # process_events get a no-op
+            update = self.update
+            process_events = getattr(self.display, 'process_events', None) or (lambda: None)
+            # Pace the loop to target_fps. Animations also throttle to their
+            # own frame rate; this bounds the loop when nothing else does,
+            # such as while paused.
+            timer = FrameTimer(1.0 / self.config.get('target_fps', 60))
+            wait = timer.wait
+            
+            while update():
+                process_events()
+                wait()
                     
         except KeyboardInterrupt:
-            if self.debug_level >= 1:
-                print(f"[SEQUENCER] Keyboard interrupt received")
+            if self._debug_enabled:
+                logger.debug("[SEQUENCER] Keyboard interrupt received")
             self.stop()
-            print("\nAnimation sequence stopped.")
\ No newline at end of file
+            print("\nAnimation sequence stopped.")
+        finally:
+            if timer is not None:
+                timer.close()
\ No newline at end of file
@@ -7,10 +7,59 @@ animated text on the Unicorn HAT Mini display.
 """
 
 import time
-import colorsys
+import math
+import functools
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy code path is used instead
+    njit = None
+
 from animation import Animation, register_animation
+from animation.colors import HUE_TABLE, HUE_COLORS
+from animation.fonts import load_font
+
+
+def _render_text_numpy(mask, colors, out, x_pos, brightness):
+    """Draw a text mask into out with its left edge at column x_pos.
+    
+    colors holds the RGB color of each column of the mask, which is scaled
+    by brightness. Pixels outside the lit text are set to black.
+    """
+    out.fill(0)
+    start = max(0, -x_pos)
+    stop = min(mask.shape[1], out.shape[1] - x_pos)
+    if stop <= start:
+        return
+    
+    colors = colors[start:stop]
+    if brightness != 1.0:
+        colors = (colors * brightness).astype(np.intp)
+    
+    lit = mask[:, start:stop]
+    region = out[:, start + x_pos:stop + x_pos]
+    region[lit] = np.broadcast_to(colors, region.shape)[lit]
+
+
+def _render_text_loop(mask, colors, out, x_pos, brightness):
+    """Draw a text mask into out, pixel by pixel (for Numba)."""
+    height, width = out.shape[:2]
+    text_width = mask.shape[1]
+    for y in range(height):
+        for x in range(width):
+            text_x = x - x_pos
+            if 0 <= text_x < text_width and mask[y, text_x]:
+                for c in range(3):
+                    out[y, x, c] = int(colors[text_x, c] * brightness)
+            else:
+                for c in range(3):
+                    out[y, x, c] = 0
+
+
+_render_text = _render_text_numpy if njit is None else njit(cache=True)(_render_text_loop)
 
 class CustomPixelFont:
     """A custom pixel font for rendering text on small displays."""
@@ -21,6 +70,31 @@ class CustomPixelFont:
         self.char_height = 5  # Height of each character in pixels
         self.char_spacing = 1  # Spacing between characters
         self.bitmap_font = self._create_pixel_bitmap_font()
+        
+        # All glyphs as one (glyph, row, column) array of 0/1 pixels, and
+        # the index of each character's glyph in it. Lowercase letters
+        # share the glyph of their uppercase letter.
+        glyphs = {}
+        self._glyph_index = {}
+        for char, bitmap in self.bitmap_font.items():
+            self._glyph_index[char] = glyphs.setdefault(bitmap, len(glyphs))
+        self._atlas = np.zeros((len(glyphs), self.char_height, self.char_width), dtype=np.uint8)
+        for bitmap, index in glyphs.items():
+            for cy, row in enumerate(bitmap):
+                for cx in range(self.char_width):
+                    self._atlas[index, cy, cx] = (row >> (self.char_width - 1 - cx)) & 1
+        
+        # Measured widths, by text
+        self._measure = functools.lru_cache(maxsize=256)(self._measure_width)
+        
+        # Rendered masks, by text, mask size and position
+        self._masks = functools.lru_cache(maxsize=64)(self._render_new_mask)
+        
+        # (dx, dy) offsets of the lit pixels of each character
+        self._lit_offsets = {}
+        for char, index in self._glyph_index.items():
+            cys, cxs = np.nonzero(self._atlas[index])
+            self._lit_offsets[char] = list(zip(cxs.tolist(), cys.tolist()))
     
     def getbbox(self, text):
         """Get the bounding box of text for PIL compatibility.
@@ -31,18 +105,19 @@ class CustomPixelFont:
         Returns:
             Tuple of (left, top, right, bottom)
         """
-        # Calculate the width of the text
-        width = 0
-        for char in text:
-            if char.upper() in self.bitmap_font:
-                width += self.char_width + self.char_spacing
-        
-        # Remove the last character spacing if there's text
-        if width > 0:
-            width -= self.char_spacing
-            
         # Return bounding box (left, top, right, bottom)
-        return (0, 0, width, self.char_height)
+        return (0, 0, self._measure(text), self.char_height)
+    
+    def _measure_width(self, text):
+        """Calculate the width of text in pixels."""
+        # Count the characters the font can draw, as render_text() sees them
+        bitmap_font = self.bitmap_font
+        count = sum(1 for char in text.upper() if char in bitmap_font)
+        
+        # No spacing after the last character
+        if count == 0:
+            return 0
+        return count * (self.char_width + self.char_spacing) - self.char_spacing
     
     def getsize(self, text):
         """Get the size of text for PIL compatibility.
@@ -72,22 +147,69 @@ class CustomPixelFont:
         text = text.upper()
         
         # Draw each character
+        lit_offsets = self._lit_offsets
         for char in text:
-            if char in self.bitmap_font:
-                # Get the bitmap for this character
-                bitmap = self.bitmap_font[char]
-                
-                # Draw each pixel of the character
-                for cy in range(self.char_height):
-                    for cx in range(self.char_width):
-                        if cy < len(bitmap) and cx < len(bitmap[cy]) and bitmap[cy][cx] == 1:
-                            draw.point((x + cx, y + cy), fill=color)
-                
-                # Move to the next character position
-                x += self.char_width + self.char_spacing
-            else:
-                # Skip unknown characters
-                x += self.char_width + self.char_spacing
+            if char in lit_offsets:
+                # Draw the lit pixels of the character
+                for cx, cy in lit_offsets[char]:
+                    draw.point((x + cx, y + cy), fill=color)
+            
+            # Move to the next character position (unknown characters
+            # are skipped)
+            x += self.char_width + self.char_spacing
+    
+    def render_mask(self, mask, text, position):
+        """Render text into a mask of lit pixels.
+        
+        Args:
+            mask: 2D uint8 NumPy array; the lit pixels of the text are set to 1
+            text: Text to render
+            position: (x, y) position to draw at
+        """
+        x, y = position
+        height, width = mask.shape
+        
+        # Rows of the characters that fall inside the mask
+        top = max(0, y)
+        bottom = min(height, y + self.char_height)
+        if top >= bottom:
+            return
+        rows = slice(top - y, bottom - y)
+        
+        # OR each character's glyph into the mask, as render_text() draws
+        # them (unknown characters are skipped)
+        atlas = self._atlas
+        glyph_index = self._glyph_index
+        for char in text.upper():
+            index = glyph_index.get(char)
+            if index is not None:
+                left = max(0, x)
+                right = min(width, x + self.char_width)
+                if left < right:
+                    mask[top:bottom, left:right] |= atlas[index, rows, left - x:right - x]
+            x += self.char_width + self.char_spacing
+    
+    def get_mask(self, text, size, position):
+        """Get the mask of lit pixels of text rendered at a position.
+        
+        Masks are cached and shared, so the returned array is read-only.
+        
+        Args:
+            text: Text to render
+            size: (height, width) of the mask
+            position: (x, y) position to draw at
+            
+        Returns:
+            2D uint8 NumPy array, 1 where the text is lit
+        """
+        return self._masks(text, tuple(size), tuple(position))
+    
+    def _render_new_mask(self, text, size, position):
+        """Render text into a new, read-only mask."""
+        mask = np.zeros(size, dtype=np.uint8)
+        self.render_mask(mask, text, position)
+        mask.flags.writeable = False
+        return mask
     
     def _create_pixel_bitmap_font(self):
         """Create a basic 5x3 pixel bitmap font that works well on small displays.
@@ -95,311 +217,54 @@ class CustomPixelFont:
         Returns:
             A dictionary mapping characters to their bitmap representations.
         """
-        # Define a minimal 5x3 pixel font (height x width)
-        # 1 means pixel on, 0 means pixel off
+        # Define a minimal 5x3 pixel font (height x width). Each glyph is
+        # five rows, top to bottom; in each row the highest of the three
+        # bits is the leftmost pixel and a set bit means pixel on.
         font = {
-            'A': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [1, 1, 1],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'B': [
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 1, 0]
-            ],
+            'A': (0b010, 0b101, 0b111, 0b101, 0b101),
+            'B': (0b110, 0b101, 0b110, 0b101, 0b110),
             # ... Add more characters as needed
-            'C': [
-                [0, 1, 1],
-                [1, 0, 0],
-                [1, 0, 0],
-                [1, 0, 0],
-                [0, 1, 1]
-            ],
-            'D': [
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 1, 0]
-            ],
-            'E': [
-                [1, 1, 1],
-                [1, 0, 0],
-                [1, 1, 0],
-                [1, 0, 0],
-                [1, 1, 1]
-            ],
-            'F': [
-                [1, 1, 1],
-                [1, 0, 0],
-                [1, 1, 0],
-                [1, 0, 0],
-                [1, 0, 0]
-            ],
-            'G': [
-                [0, 1, 1],
-                [1, 0, 0],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 1]
-            ],
-            'H': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 1, 1],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'I': [
-                [1, 1, 1],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0],
-                [1, 1, 1]
-            ],
-            'J': [
-                [0, 0, 1],
-                [0, 0, 1],
-                [0, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            'K': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'L': [
-                [1, 0, 0],
-                [1, 0, 0],
-                [1, 0, 0],
-                [1, 0, 0],
-                [1, 1, 1]
-            ],
-            'M': [
-                [1, 0, 1],
-                [1, 1, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'N': [
-                [1, 0, 1],
-                [1, 1, 1],
-                [1, 1, 1],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'O': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            'P': [
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 1, 0],
-                [1, 0, 0],
-                [1, 0, 0]
-            ],
-            'Q': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 1]
-            ],
-            'R': [
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'S': [
-                [0, 1, 1],
-                [1, 0, 0],
-                [0, 1, 0],
-                [0, 0, 1],
-                [1, 1, 0]
-            ],
-            'T': [
-                [1, 1, 1],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0]
-            ],
-            'U': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            'V': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0],
-                [0, 1, 0]
-            ],
-            'W': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 1, 1],
-                [1, 0, 1]
-            ],
-            'X': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1]
-            ],
-            'Y': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0]
-            ],
-            'Z': [
-                [1, 1, 1],
-                [0, 0, 1],
-                [0, 1, 0],
-                [1, 0, 0],
-                [1, 1, 1]
-            ],
-            '0': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            '1': [
-                [0, 1, 0],
-                [1, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0],
-                [1, 1, 1]
-            ],
-            '2': [
-                [1, 1, 0],
-                [0, 0, 1],
-                [0, 1, 0],
-                [1, 0, 0],
-                [1, 1, 1]
-            ],
-            '3': [
-                [1, 1, 0],
-                [0, 0, 1],
-                [0, 1, 0],
-                [0, 0, 1],
-                [1, 1, 0]
-            ],
-            '4': [
-                [1, 0, 1],
-                [1, 0, 1],
-                [1, 1, 1],
-                [0, 0, 1],
-                [0, 0, 1]
-            ],
-            '5': [
-                [1, 1, 1],
-                [1, 0, 0],
-                [1, 1, 0],
-                [0, 0, 1],
-                [1, 1, 0]
-            ],
-            '6': [
-                [0, 1, 1],
-                [1, 0, 0],
-                [1, 1, 0],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            '7': [
-                [1, 1, 1],
-                [0, 0, 1],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0]
-            ],
-            '8': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [0, 1, 0],
-                [1, 0, 1],
-                [0, 1, 0]
-            ],
-            '9': [
-                [0, 1, 0],
-                [1, 0, 1],
-                [0, 1, 1],
-                [0, 0, 1],
-                [0, 1, 0]
-            ],
-            ' ': [
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0]
-            ],
-            '.': [
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 1, 0]
-            ],
-            ',': [
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 0, 0],
-                [0, 1, 0],
-                [1, 0, 0]
-            ],
-            '!': [
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 1, 0],
-                [0, 0, 0],
-                [0, 1, 0]
-            ],
-            '?': [
-                [1, 1, 0],
-                [0, 0, 1],
-                [0, 1, 0],
-                [0, 0, 0],
-                [0, 1, 0]
-            ],
-            ':': [
-                [0, 0, 0],
-                [0, 1, 0],
-                [0, 0, 0],
-                [0, 1, 0],
-                [0, 0, 0]
-            ],
-            '-': [
-                [0, 0, 0],
-                [0, 0, 0],
-                [1, 1, 1],
-                [0, 0, 0],
-                [0, 0, 0]
-            ]
+            'C': (0b011, 0b100, 0b100, 0b100, 0b011),
+            'D': (0b110, 0b101, 0b101, 0b101, 0b110),
+            'E': (0b111, 0b100, 0b110, 0b100, 0b111),
+            'F': (0b111, 0b100, 0b110, 0b100, 0b100),
+            'G': (0b011, 0b100, 0b101, 0b101, 0b011),
+            'H': (0b101, 0b101, 0b111, 0b101, 0b101),
+            'I': (0b111, 0b010, 0b010, 0b010, 0b111),
+            'J': (0b001, 0b001, 0b001, 0b101, 0b010),
+            'K': (0b101, 0b101, 0b110, 0b101, 0b101),
+            'L': (0b100, 0b100, 0b100, 0b100, 0b111),
+            'M': (0b101, 0b111, 0b101, 0b101, 0b101),
+            'N': (0b101, 0b111, 0b111, 0b101, 0b101),
+            'O': (0b010, 0b101, 0b101, 0b101, 0b010),
+            'P': (0b110, 0b101, 0b110, 0b100, 0b100),
+            'Q': (0b010, 0b101, 0b101, 0b101, 0b011),
+            'R': (0b110, 0b101, 0b110, 0b101, 0b101),
+            'S': (0b011, 0b100, 0b010, 0b001, 0b110),
+            'T': (0b111, 0b010, 0b010, 0b010, 0b010),
+            'U': (0b101, 0b101, 0b101, 0b101, 0b010),
+            'V': (0b101, 0b101, 0b101, 0b010, 0b010),
+            'W': (0b101, 0b101, 0b101, 0b111, 0b101),
+            'X': (0b101, 0b101, 0b010, 0b101, 0b101),
+            'Y': (0b101, 0b101, 0b010, 0b010, 0b010),
+            'Z': (0b111, 0b001, 0b010, 0b100, 0b111),
+            '0': (0b010, 0b101, 0b101, 0b101, 0b010),
+            '1': (0b010, 0b110, 0b010, 0b010, 0b111),
+            '2': (0b110, 0b001, 0b010, 0b100, 0b111),
+            '3': (0b110, 0b001, 0b010, 0b001, 0b110),
+            '4': (0b101, 0b101, 0b111, 0b001, 0b001),
+            '5': (0b111, 0b100, 0b110, 0b001, 0b110),
+            '6': (0b011, 0b100, 0b110, 0b101, 0b010),
+            '7': (0b111, 0b001, 0b010, 0b010, 0b010),
+            '8': (0b010, 0b101, 0b010, 0b101, 0b010),
+            '9': (0b010, 0b101, 0b011, 0b001, 0b010),
+            ' ': (0b000, 0b000, 0b000, 0b000, 0b000),
+            '.': (0b000, 0b000, 0b000, 0b000, 0b010),
+            ',': (0b000, 0b000, 0b000, 0b010, 0b100),
+            '!': (0b010, 0b010, 0b010, 0b000, 0b010),
+            '?': (0b110, 0b001, 0b010, 0b000, 0b010),
+            ':': (0b000, 0b010, 0b000, 0b010, 0b000),
+            '-': (0b000, 0b000, 0b111, 0b000, 0b000)
         }
         
         # Add lowercase letters (same as uppercase for simplicity)
@@ -409,7 +274,19 @@ class CustomPixelFont:
         return font
 
 
-@register_animation(name="TextAnimation")
+@functools.lru_cache(maxsize=256)
+def _font_bbox(font, text):
+    """Get the bounding box of text in a font, once for each font and text."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_pixel_font():
+    """Return the CustomPixelFont instance shared by all text animations."""
+    return CustomPixelFont()
+
+
+@register_animation
 class TextAnimation(Animation):
     """Base class for text animations.
     
@@ -417,6 +294,17 @@ class TextAnimation(Animation):
     handling text rendering, positioning, and basic configuration.
     """
     
+    opaque = True
+    
+    def __init__(self, display, config=None):
+        """Initialize the text animation."""
+        super().__init__(display, config)
+        
+        # Render once up front, so that any JIT compilation of the render
+        # function happens now rather than during the first frame
+        _render_text(np.zeros((1, 1), dtype=bool), np.zeros((1, 3), dtype=np.intp),
+                     np.zeros((1, 1, 3), dtype=np.uint8), 0, 1.0)
+    
     def setup(self):
         """Set up the text animation."""
         super().setup()
@@ -444,22 +332,26 @@ class TextAnimation(Animation):
         
         # Create text image
         self.create_text_image()
+        
+        # Frame buffer the text is drawn into
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
     
     def setup_font(self):
         """Set up the font for text rendering."""
         if self.use_custom_font:
-            # Use our custom pixel font
-            self.font = CustomPixelFont()
+            # Use our custom pixel font; it holds no per-animation state, so
+            # one instance (and its measurements) is shared
+            self.font = _shared_pixel_font()
             print(f"Using custom pixel font for '{self.text}'")
         else:
             # Try to load a system font
             try:
                 if self.font_path:
-                    self.font = ImageFont.truetype(self.font_path, self.font_size)
+                    self.font = load_font(self.font_path, self.font_size)
                 else:
                     # Try common system fonts, fall back to default
                     try:
-                        self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", self.font_size)
+                        self.font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", self.font_size)
                     except IOError:
                         self.font = ImageFont.load_default()
             except Exception as e:
@@ -479,8 +371,8 @@ class TextAnimation(Animation):
             else:
                 # For PIL fonts
                 try:
-                    # For newer PIL versions
-                    left, top, right, bottom = self.font.getbbox(self.text)
+                    # For newer PIL versions (measured once per font and text)
+                    left, top, right, bottom = _font_bbox(self.font, self.text)
                     self.text_width = right - left
                     self.text_height = bottom - top
                 except AttributeError:
@@ -496,10 +388,6 @@ class TextAnimation(Animation):
     
     def create_text_image(self):
         """Create the text image with current settings."""
-        # Create an image large enough to hold the text
-        self.text_image = Image.new("RGB", (max(1, self.text_width), self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(self.text_image)
-        
         # Calculate position for text
         if self.position == 'center':
             x = 0  # For text image, always start at left edge
@@ -520,15 +408,95 @@ class TextAnimation(Animation):
             y = (self.height - self.text_height) // 2
         
         # Render the text
-        if isinstance(self.font, CustomPixelFont):
-            # Use our custom pixel font renderer
-            self.font.render_text(draw, self.text, (x, y), self.color)
-        else:
-            # Use PIL's text rendering
-            draw.text((x, y), self.text, font=self.font, fill=self.color)
+        self.render_text(self.text, (x, y))
             
         print(f"Created text image at position ({x}, {y})")
     
+    def render_text(self, text, position):
+        """Render text into the text image and update the drawing buffers.
+        
+        The custom pixel font renders straight into the mask of lit pixels,
+        without a text image (text_image is None); PIL fonts are drawn into
+        an RGB text image.
+        
+        Args:
+            text: Text to render
+            position: (x, y) position in the text image to draw at
+        """
+        size = (self.height, max(1, self.text_width))
+        
+        if isinstance(self.font, CustomPixelFont):
+            # Use our custom pixel font renderer; the same text at the same
+            # position is only rendered once
+            self.text_image = None
+            self.update_text_buffers(self.font.get_mask(text, size, position))
+        else:
+            # Use PIL's text rendering into an image large enough to hold the text
+            self.text_image = Image.new("RGB", size[::-1], (0, 0, 0))
+            draw = ImageDraw.Draw(self.text_image)
+            draw.text(position, text, font=self.font, fill=self.color)
+            self.update_text_buffers()
+    
+    def set_position(self, position):
+        """Move the text to a new position, keeping the font and colors.
+        
+        Args:
+            position: 'center', 'top', 'bottom', or (x, y)
+        """
+        self.position = position
+        self.create_text_image()
+    
+    def set_color_mode(self, color_mode):
+        """Switch to a new color mode without rendering the text again.
+        
+        Args:
+            color_mode: 'static', 'rainbow' or 'pulse'
+        """
+        self.color_mode = color_mode
+        self.update_text_buffers(self.text_mask)
+    
+    def update_text_buffers(self, mask=None):
+        """Derive the arrays used for drawing from the text image.
+        
+        Call this after the text image or the color settings change.
+        
+        Args:
+            mask: Lit pixels of the text, if not derived from the text image
+        """
+        # Which pixels of the text image are lit (not black)
+        if mask is None:
+            self.text_mask = np.asarray(self.text_image).any(axis=-1)
+        else:
+            self.text_mask = mask.astype(bool)
+        
+        # Look up the color mode once here rather than on every frame
+        self._color_fn = {
+            'static': self._color_static,
+            'rainbow': self._color_rainbow,
+            'pulse': self._color_pulse,
+        }.get(self.color_mode, self._color_static)
+        self._inv_text_width = 1.0 / max(1, self.text_width)
+        
+        # Outside rainbow mode every lit pixel has the same base color, so
+        # the text is colored once here rather than on every frame
+        if self.color_mode == 'rainbow':
+            self.text_strip = None
+            self._strip_scale = None
+            # Position of each column along the text, for the hue
+            self._column_positions = np.arange(self.text_mask.shape[1]) / float(max(1, self.text_width))
+            return
+        
+        color = self.color
+        if self.color_mode == 'pulse':
+            self._strip_scale = self._pulse_level
+            if not (isinstance(color, tuple) and len(color) == 3):
+                # Default to pulsing white, as in get_color()
+                color = (255, 255, 255)
+        else:
+            self._strip_scale = None
+        self.text_strip = np.zeros(self.text_mask.shape + (3,), dtype=np.uint8)
+        self.text_strip[self.text_mask] = color
+    
     def get_color(self, x, y, t):
         """Get color for a pixel based on the color mode.
         
@@ -540,60 +508,94 @@ class TextAnimation(Animation):
         Returns:
             RGB color tuple (r, g, b)
         """
-        if self.color_mode == 'static':
-            # Static color
-            return self.color
-        
-        elif self.color_mode == 'rainbow':
-            # Rainbow color based on position
-            char_position = x / float(max(1, self.text_width))
-            hue = (char_position + t * 0.2) % 1.0
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+        return self._color_fn(x, y, t)
+    
+    def _color_static(self, x, y, t):
+        """Static color."""
+        return self.color
+    
+    def _color_rainbow(self, x, y, t):
+        """Rainbow color based on position."""
+        char_position = x * self._inv_text_width
+        hue = (char_position + t * 0.2) % 1.0
+        return HUE_COLORS[int(hue * 1536) % 1536]
+    
+    def _color_pulse(self, x, y, t):
+        """Pulsing color effect."""
+        pulse = self._pulse_level(t)
+        if isinstance(self.color, tuple) and len(self.color) == 3:
+            r, g, b = self.color
+            r = int(r * pulse)
+            g = int(g * pulse)
+            b = int(b * pulse)
             return (r, g, b)
+        else:
+            # Default to pulsing white
+            v = int(255 * pulse)
+            return (v, v, v)
+    
+    @staticmethod
+    def _pulse_level(t):
+        """Brightness of the pulse effect at time t, from 0.0 to 1.0."""
+        return (math.sin(t * 2) + 1) / 2
+    
+    def get_column_colors(self, t):
+        """Get the color of each column of the text image.
         
-        elif self.color_mode == 'pulse':
-            # Pulsing color effect
-            pulse = (math.sin(t * 2) + 1) / 2  # 0.0 to 1.0
-            if isinstance(self.color, tuple) and len(self.color) == 3:
-                r, g, b = self.color
-                r = int(r * pulse)
-                g = int(g * pulse)
-                b = int(b * pulse)
-                return (r, g, b)
-            else:
-                # Default to pulsing white
-                v = int(255 * pulse)
-                return (v, v, v)
+        None of the color modes vary the color within a column.
         
-        # Default to static color
-        return self.color
+        Args:
+            t: Current time in seconds
+            
+        Returns:
+            Integer array of shape (text image width, 3) of RGB colors
+        """
+        if self.text_strip is None:
+            # Rainbow color based on position, as in _color_rainbow()
+            hue = (self._column_positions + t * 0.2) % 1.0
+            return HUE_TABLE[(hue * 1536).astype(np.intp) % 1536].astype(np.intp)
+        
+        # Other modes color every column the same
+        colors = np.empty((self.text_mask.shape[1], 3), dtype=np.intp)
+        colors[:] = self._color_fn(0, 0, t)
+        return colors
     
-    def update(self, dt):
-        """Update the text animation."""
-        self.display.clear()
+    def draw_text(self, x_pos, brightness=1.0):
+        """Draw the text image with its left edge at display column x_pos.
         
-        # Calculate center position for the text image
-        x_pos = (self.width - self.text_width) // 2
-        y_pos = 0  # Not needed since vertical positioning is handled in the text image
+        The whole display is redrawn: the lit pixels of the text image in
+        the colors of the current color mode scaled by brightness, and
+        everything else black.
+        """
+        t = time.monotonic() - self.start_time
+        frame = self._frame
+        strip = self.text_strip
         
-        # Draw the text image with current color mode
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_pos
-                
-                # Only process pixels within the text image
-                if 0 <= text_x < self.text_width:
-                    # Get the pixel from the text image
-                    pixel = self.text_image.getpixel((text_x, y))
-                    
-                    # If the pixel is not black (i.e., part of the text)
-                    if pixel != (0, 0, 0):
-                        # Get color based on our color mode
-                        color = self.get_color(text_x, y, time.time() - self.start_time)
-                        self.display.set_pixel(x, y, *color)
-
-
-@register_animation(name="StaticTextAnimation")
+        if strip is None:
+            # Rainbow mode: color the text while drawing it
+            _render_text(self.text_mask, self.get_column_colors(t), frame, x_pos, brightness)
+        else:
+            # Copy the visible part of the pre-colored text
+            frame.fill(0)
+            start = max(0, -x_pos)
+            stop = min(strip.shape[1], self.width - x_pos)
+            if stop > start:
+                window = strip[:, start:stop]
+                if self._strip_scale is not None:
+                    window = (window * self._strip_scale(t)).astype(np.uint8)
+                if brightness != 1.0:
+                    window = (window * brightness).astype(np.uint8)
+                frame[:, start + x_pos:stop + x_pos] = window
+        
+        self.blit(frame)
+    
+    def update(self, dt):
+        """Update the text animation."""
+        # Draw the text image centered, with current color mode
+        self.draw_text((self.width - self.text_width) // 2)
+
+
+@register_animation
 class StaticTextAnimation(TextAnimation):
     """Static text animation that displays fixed text in the center of the screen.
     
@@ -612,31 +614,16 @@ class StaticTextAnimation(TextAnimation):
     
     def update(self, dt):
         """Update the static text animation."""
-        self.display.clear()
-        
         # Calculate position with offset
         offset_x, offset_y = self.display_offset
         x_pos = ((self.width - self.text_width) // 2) + offset_x
         
         # Draw the text image with current color mode
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_pos
-                
-                # Only process pixels within the text image
-                if 0 <= text_x < self.text_width:
-                    # Get the pixel from the text image
-                    pixel = self.text_image.getpixel((text_x, y))
-                    
-                    # If the pixel is not black (i.e., part of the text)
-                    if pixel != (0, 0, 0):
-                        # Get color based on our color mode
-                        color = self.get_color(text_x, y, time.time() - self.start_time)
-                        self.display.set_pixel(x, y, *color)
+        self.draw_text(x_pos)
 
 
 
-@register_animation(name="ScrollingTextAnimation")
+@register_animation
 class ScrollingTextAnimation(TextAnimation):
     """Horizontal scrolling text animation."""
 
@@ -648,8 +635,6 @@ class ScrollingTextAnimation(TextAnimation):
 
     def update(self, dt):
         """Update the scrolling text animation."""
-        self.display.clear()
-
         # Update scroll position
         self.scroll_x -= self.scroll_speed * dt
         if self.scroll_x < -self.text_width:
@@ -659,17 +644,10 @@ class ScrollingTextAnimation(TextAnimation):
         x_offset = int(self.scroll_x)
 
         # Draw the text image with scrolling offset
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_offset
-                if 0 <= text_x < self.text_width:
-                    pixel = self.text_image.getpixel((text_x, y))
-                    if pixel != (0, 0, 0):
-                        color = self.get_color(text_x, y, time.time() - self.start_time)
-                        self.display.set_pixel(x, y, *color)
+        self.draw_text(x_offset)
 
 
-@register_animation(name="TypewriterAnimation")
+@register_animation
 class TypewriterAnimation(TextAnimation):
     """Typewriter text animation."""
 
@@ -682,41 +660,27 @@ class TypewriterAnimation(TextAnimation):
 
     def update(self, dt):
         """Update the typewriter text animation."""
-        self.display.clear()
-
         # Determine number of characters to type based on time
-        time_elapsed = time.time() - self.last_type_time
+        time_elapsed = time.monotonic() - self.last_type_time
         chars_to_type = int(time_elapsed * self.type_speed)
 
         if chars_to_type > 0:
             self.typed_chars = min(len(self.text), self.typed_chars + chars_to_type)
-            self.last_type_time = time.time()
+            self.last_type_time = time.monotonic()
 
         # Render only the typed portion of the text
         current_text = self.text[:self.typed_chars]
 
-        # Re-create text image with the current text
-        self.text_image = Image.new("RGB", (max(1, self.text_width), self.height), (0, 0, 0)) # Re-use self.text_width, might be slightly off if text changes drastically
-        draw = ImageDraw.Draw(self.text_image)
-
-        if isinstance(self.font, CustomPixelFont):
-            self.font.render_text(draw, current_text, (0, (self.height - self.text_height) // 2), self.color) # Default to center position
-        else:
-            draw.text((0, (self.height - self.text_height) // 2), current_text, font=self.font, fill=self.color)
+        # Re-render the text with the current text (re-uses self.text_width,
+        # might be slightly off if text changes drastically)
+        self.render_text(current_text, (0, (self.height - self.text_height) // 2)) # Default to center position
 
         # Draw the text image
         x_pos = (self.width - self.text_width) // 2 # Center horizontally - might need adjustment for dynamic text width
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_pos
-                if 0 <= text_x < self.text_width: # Use original text_width for bounds
-                    pixel = self.text_image.getpixel((text_x, y))
-                    if pixel != (0, 0, 0):
-                        color = self.get_color(text_x, y, time.time() - self.start_time)
-                        self.display.set_pixel(x, y, *color)
+        self.draw_text(x_pos)
 
 
-@register_animation(name="FadeTextAnimation")
+@register_animation
 class FadeTextAnimation(TextAnimation):
     """Fade in/out text animation."""
 
@@ -729,9 +693,7 @@ class FadeTextAnimation(TextAnimation):
 
     def update(self, dt):
         """Update the fade text animation."""
-        self.display.clear()
-
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         cycle_time = elapsed_time % self.fade_duration # Time within the fade cycle
         alpha = 0.0 # Opacity
 
@@ -745,22 +707,10 @@ class FadeTextAnimation(TextAnimation):
         alpha = max(0.0, min(1.0, alpha)) # Ensure alpha is within 0-1 range
 
         # Draw the text image with alpha blending
-        x_pos = (self.width - self.text_width) // 2
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_pos
-                if 0 <= text_x < self.text_width:
-                    pixel = self.text_image.getpixel((text_x, y))
-                    if pixel != (0, 0, 0):
-                        base_color = self.get_color(text_x, y, time.time() - self.start_time)
-                        r, g, b = base_color
-                        display_r = int(r * alpha)
-                        display_g = int(g * alpha)
-                        display_b = int(b * alpha)
-                        self.display.set_pixel(x, y, display_r, display_g, display_b)
-
-
-@register_animation(name="PulsingTextAnimation")
+        self.draw_text((self.width - self.text_width) // 2, alpha)
+
+
+@register_animation
 class PulsingTextAnimation(TextAnimation):
     """Pulsing text animation (size/brightness)."""
 
@@ -772,24 +722,10 @@ class PulsingTextAnimation(TextAnimation):
 
     def update(self, dt):
         """Update the pulsing text animation."""
-        self.display.clear()
-
         # Calculate pulse factor (0.0 to 1.0)
-        t = time.time() - self.start_time
+        t = time.monotonic() - self.start_time
         pulse = (math.sin(t * self.pulse_rate * 2 * math.pi - math.pi/2) + 1) / 2
         brightness = self.min_brightness + (1.0 - self.min_brightness) * pulse
 
         # Draw the text image with brightness modulation
-        x_pos = (self.width - self.text_width) // 2
-        for y in range(self.height):
-            for x in range(self.width):
-                text_x = x - x_pos
-                if 0 <= text_x < self.text_width:
-                    pixel = self.text_image.getpixel((text_x, y))
-                    if pixel != (0, 0, 0):
-                        base_color = self.get_color(text_x, y, time.time() - self.start_time)
-                        r, g, b = base_color
-                        display_r = int(r * brightness)
-                        display_g = int(g * brightness)
-                        display_b = int(b * brightness)
-                        self.display.set_pixel(x, y, display_r, display_g, display_b)
\ No newline at end of file
+        self.draw_text((self.width - self.text_width) // 2, brightness)
\ No newline at end of file
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Frame pacing for Unicorn HAT Mini animation loops.
+
+This module provides the FrameTimer used by the sequencer and the
+standalone scripts to run their main loops at a steady frame rate.
+"""
+
+import os
+import time
+
+
+class FrameTimer:
+    """Waits for evenly spaced frame ticks.
+
+    Where the os module has timerfd support (Linux, Python 3.13+), a kernel
+    timer ticks at the frame period and each wait blocks reading it;
+    otherwise waits sleep until the next frame on the monotonic clock.
+    Either way frames that are missed are skipped, not caught up. A period
+    of zero or less does not pace frames at all.
+    """
+
+    def __init__(self, period):
+        """Start the frame ticks, period seconds apart."""
+        self.period = period
+        self.fd = None
+        # A zero interval would disarm the kernel timer and block wait()
+        # for good, so unpaced loops never get one
+        if period > 0 and hasattr(os, 'timerfd_create'):
+            self.fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+            os.timerfd_settime(self.fd, initial=period, interval=period)
+        self.next_frame = time.monotonic()
+
+    def wait(self):
+        """Wait until the next frame tick."""
+        if self.fd is not None:
+            # Blocks until the timer has expired at least once; the count
+            # of expirations it returns is not needed
+            os.read(self.fd, 8)
+            return
+        if self.period <= 0:
+            return
+
+        self.next_frame += self.period
+        sleep_for = self.next_frame - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        else:
+            # Running late; restart the schedule rather than rushing
+            # through frames to catch up
+            self.next_frame = time.monotonic()
+
+    def close(self):
+        """Stop the frame ticks."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -46,11 +46,13 @@ else:  # Raspberry Pi or other Linux system
 # Import our animation system
 from animation import (
     Animation,
+    enable_debug_output,
     register_animation,
     get_animation_names,
     discover_animations,
     AnimationSequencer
 )
+from animation.timing import FrameTimer
 
 # Import animation modules - this will register animations via decorators
 import animation.effects
@@ -80,6 +82,9 @@ def parse_arguments():
     parser.add_argument('--interactive', '-i', action='store_true',
                         help='Enable interactive mode (buttons control animations)')
     
+    parser.add_argument('--async-show', action='store_true',
+                        help='Write frames to the display on a background thread (hardware only)')
+    
     return parser.parse_args()
 
 
@@ -118,7 +123,7 @@ def setup_button_handlers(sequencer, display):
         current_anim = sequencer.current_animation
         if current_anim:
             name = current_anim.name
-            elapsed = time.time() - current_anim.start_time
+            elapsed = time.monotonic() - current_anim.start_time
             duration = current_anim.duration
             print(f"Current animation: {name}")
             print(f"Elapsed time: {elapsed:.1f}s / {duration:.1f}s")
@@ -160,65 +165,76 @@ def run_menu(display, sequencer):
         
         # Wait for button press
         while True:
-            if display.read_button(display.BUTTON_A):
-                # Previous option
+            buttons = read_buttons_bitmask(display)
+            if buttons & 0b0001:
+                # Button A: previous option
                 selected_index = (selected_index - 1) % len(options)
                 break
-            elif display.read_button(display.BUTTON_B):
-                # Next option
+            elif buttons & 0b0010:
+                # Button B: next option
                 selected_index = (selected_index + 1) % len(options)
                 break
-            elif display.read_button(display.BUTTON_X):
-                # Run the selected animation
+            elif buttons & 0b0100:
+                # Button X: run the selected animation
                 sequencer.jump_to(selected_index)
                 sequencer.start()
                 return
-            elif display.read_button(display.BUTTON_Y):
-                # Quit the menu
+            elif buttons & 0b1000:
+                # Button Y: quit the menu
                 return
             
             time.sleep(0.1)
 
 
 
-def handle_button_presses(display, sequencer):
-    """Handle button presses and pass them to the sequencer."""
-    buttons = [
-        display.BUTTON_A,
-        display.BUTTON_B,
-        display.BUTTON_X,
-        display.BUTTON_Y
-    ]
+def read_buttons_bitmask(display):
+    """Read the state of all buttons as a bitmask.
     
-    button_names = {
-        display.BUTTON_A: "A",
-        display.BUTTON_B: "B",
-        display.BUTTON_X: "X",
-        display.BUTTON_Y: "Y"
-    }
+    Bit 0 is button A, then B, X and Y. Uses a single read where the display
+    supports it.
+    """
+    if hasattr(display, 'read_buttons_bitmask'):
+        return display.read_buttons_bitmask()
     
-    # Track previous button states
-    prev_states = {button: False for button in buttons}
+    mask = 0
+    for bit, button in enumerate((display.BUTTON_A, display.BUTTON_B, display.BUTTON_X, display.BUTTON_Y)):
+        if display.read_button(button):
+            mask |= 1 << bit
+    return mask
+
+def handle_button_presses(display, sequencer, prev_mask=0):
+    """Handle button presses and pass them to the sequencer.
     
-    # Read current button states
-    curr_states = {button: display.read_button(button) for button in buttons}
+    Args:
+        display: The display to read the buttons of
+        sequencer: The sequencer to pass button presses to
+        prev_mask: Button bitmask returned by the previous call
+        
+    Returns:
+        The current button bitmask, to pass to the next call
+    """
+    mask = read_buttons_bitmask(display)
     
     # Check for button presses (transitions from not pressed to pressed)
-    for button in buttons:
-        if curr_states[button] and not prev_states[button]:
-            # Button was just pressed
-            print(f"Button {button_names.get(button, button)} pressed")
-            sequencer.handle_button_press(button)
+    pressed = mask & ~prev_mask
+    if pressed:
+        buttons = (display.BUTTON_A, display.BUTTON_B, display.BUTTON_X, display.BUTTON_Y)
+        for bit, name in enumerate("ABXY"):
+            if pressed & (1 << bit):
+                # Button was just pressed
+                print(f"Button {name} pressed")
+                sequencer.handle_button_press(buttons[bit])
     
-    # Update previous states
-    for button in buttons:
-        prev_states[button] = curr_states[button]
+    return mask
 
 
 def main():
     """Main function."""
     args = parse_arguments()
     
+    # Show animation debug output on the console
+    enable_debug_output()
+    
     # List animations if requested
     if args.list:
         list_animations()
@@ -234,7 +250,7 @@ def main():
     
     # Create animation sequencer
     config_file = args.config if os.path.exists(args.config) else None
-    sequencer = AnimationSequencer(display, config_file)
+    sequencer = AnimationSequencer(display, config_file, async_show=args.async_show or None)
     
     if args.interactive:
         # Set up button handlers
@@ -257,13 +273,16 @@ def main():
                 print(f"  - {name}")
             return
     
+    timer = None
     try:
         # Start the animation sequence
         # sequencer.start()
         # Show the animation selection menu
         run_menu(display, sequencer)
         
-        # Main loop
+        # Main loop, paced to the sequencer's target frame rate
+        button_mask = 0
+        timer = FrameTimer(1.0 / sequencer.config.get('target_fps', 60))
         while True:
             # Update the animation sequencer
             if not sequencer.update():
@@ -271,19 +290,22 @@ def main():
             
             # Handle button presses if interactive
             if args.interactive:
-                handle_button_presses(display, sequencer)
+                button_mask = handle_button_presses(display, sequencer, button_mask)
             
             # Process display events if available
             if hasattr(display, 'process_events'):
                 display.process_events()
             
-            # Short delay to prevent CPU hogging
-            time.sleep(0.01)
+            # Wait until the next frame is due
+            timer.wait()
             
     except KeyboardInterrupt:
         print("\nInterrupted by user. Exiting...")
     finally:
-        # Clean up
+        # Clean up, after any frame still being written to the display
+        if timer is not None:
+            timer.close()
+        sequencer.stop()
         clear_display(display)
 
 
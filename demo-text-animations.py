@@ -46,6 +46,8 @@ except ImportError:
         print("Or place unicornhatutils.py in the same directory.")
         sys.exit(1)
 
+from animation.timing import FrameTimer
+
 try:
     # Import our text animations
     from animation.text import TextAnimation, StaticTextAnimation
@@ -83,29 +85,42 @@ class TextAnimationDemo:
         self.duration = duration
         self.width, self.height = display.get_shape()
         
-        # Current settings
-        self.current_position = "center"
-        self.current_color_mode = "rainbow"
-        self.current_animation_type = "StaticTextAnimation"
-        
         # Available options
         self.positions = ["top", "center", "bottom"]
         self.color_modes = ["static", "rainbow", "pulse"]
         self.animation_types = ["StaticTextAnimation", "TextAnimation"]
         
+        # Current settings, as indexes into the options
+        self.position_idx = 1  # center
+        self.color_mode_idx = 1  # rainbow
+        self.animation_type_idx = 0  # StaticTextAnimation
+        
+        # The current settings by name, updated by create_animation()
+        self.current_position = None
+        self.current_color_mode = None
+        self.current_animation_type = None
+        
         # Current animation
         self.animation = None
         
-        # Button state tracking
-        self.prev_button_states = {
-            self.display.BUTTON_A: False,
-            self.display.BUTTON_B: False,
-            self.display.BUTTON_X: False,
-            self.display.BUTTON_Y: False
-        }
+        # Button state tracking: bits 0-3 are buttons A, B, X and Y
+        self.prev_buttons = 0
+        
+        # Reads all the buttons at once, if the display supports it
+        self._read_buttons_bitmask = getattr(display, 'read_buttons_bitmask', None)
+        
+        # Button pins, bound once rather than looked up on every read
+        self._btn_a = display.BUTTON_A
+        self._btn_b = display.BUTTON_B
+        self._btn_x = display.BUTTON_X
+        self._btn_y = display.BUTTON_Y
     
     def create_animation(self):
         """Create an animation with current settings."""
+        self.current_position = self.positions[self.position_idx]
+        self.current_color_mode = self.color_modes[self.color_mode_idx]
+        self.current_animation_type = self.animation_types[self.animation_type_idx]
+        
         # Create configuration
         config = {
             'text': self.text,
@@ -128,49 +143,50 @@ class TextAnimationDemo:
     
     def handle_buttons(self):
         """Check for button presses and handle accordingly."""
-        # Read current button states
-        curr_a = self.display.read_button(self.display.BUTTON_A)
-        curr_b = self.display.read_button(self.display.BUTTON_B)
-        curr_x = self.display.read_button(self.display.BUTTON_X)
-        curr_y = self.display.read_button(self.display.BUTTON_Y)
+        # Read current button states into one bitmask
+        if self._read_buttons_bitmask is not None:
+            curr = self._read_buttons_bitmask()
+        else:
+            read_button = self.display.read_button
+            curr = (read_button(self._btn_a)
+                    | read_button(self._btn_b) << 1
+                    | read_button(self._btn_x) << 2
+                    | read_button(self._btn_y) << 3)
         
         # Check for button presses (transitions from not pressed to pressed)
-        if curr_a and not self.prev_button_states[self.display.BUTTON_A]:
+        pressed = ~self.prev_buttons & curr & 0xF
+        
+        if pressed & 0b0001:
             # Button A: Change position
-            idx = self.positions.index(self.current_position)
-            idx = (idx + 1) % len(self.positions)
-            self.current_position = self.positions[idx]
+            self.position_idx = (self.position_idx + 1) % len(self.positions)
+            self.current_position = self.positions[self.position_idx]
             
-            # Recreate animation with new settings
-            self.create_animation()
+            # Move the text of the current animation
+            self.animation.set_position(self.current_position)
+            print(f"Changed position to {self.current_position}")
         
-        if curr_b and not self.prev_button_states[self.display.BUTTON_B]:
+        if pressed & 0b0010:
             # Button B: Change color mode
-            idx = self.color_modes.index(self.current_color_mode)
-            idx = (idx + 1) % len(self.color_modes)
-            self.current_color_mode = self.color_modes[idx]
+            self.color_mode_idx = (self.color_mode_idx + 1) % len(self.color_modes)
+            self.current_color_mode = self.color_modes[self.color_mode_idx]
             
-            # Recreate animation with new settings
-            self.create_animation()
+            # Recolor the text of the current animation
+            self.animation.set_color_mode(self.current_color_mode)
+            print(f"Changed color mode to {self.current_color_mode}")
         
-        if curr_x and not self.prev_button_states[self.display.BUTTON_X]:
+        if pressed & 0b0100:
             # Button X: Toggle animation type
-            idx = self.animation_types.index(self.current_animation_type)
-            idx = (idx + 1) % len(self.animation_types)
-            self.current_animation_type = self.animation_types[idx]
+            self.animation_type_idx = (self.animation_type_idx + 1) % len(self.animation_types)
             
             # Recreate animation with new settings
             self.create_animation()
         
-        if curr_y and not self.prev_button_states[self.display.BUTTON_Y]:
+        if pressed & 0b1000:
             # Button Y: Exit demo
             return False
         
         # Update previous button states
-        self.prev_button_states[self.display.BUTTON_A] = curr_a
-        self.prev_button_states[self.display.BUTTON_B] = curr_b
-        self.prev_button_states[self.display.BUTTON_X] = curr_x
-        self.prev_button_states[self.display.BUTTON_Y] = curr_y
+        self.prev_buttons = curr
         
         return True
     
@@ -180,9 +196,10 @@ class TextAnimationDemo:
         self.create_animation()
         
         # Start time
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Main loop
+        timer = None
         try:
             print("Demo running... Press Ctrl+C to exit")
             print("Button controls:")
@@ -191,7 +208,8 @@ class TextAnimationDemo:
             print("  X: Toggle animation type")
             print("  Y: Exit the demo")
             
-            while time.time() - start_time < self.duration:
+            timer = FrameTimer(1.0 / 30.0)
+            while time.monotonic() - start_time < self.duration:
                 # Calculate delta time
                 dt = 1.0 / 30.0  # Fixed for demo
                 
@@ -207,13 +225,15 @@ class TextAnimationDemo:
                 if hasattr(self.display, 'process_events'):
                     self.display.process_events()
                 
-                # Sleep to control frame rate
-                time.sleep(1.0 / 30.0)
+                # Wait until the next frame is due
+                timer.wait()
         
         except KeyboardInterrupt:
             print("\nDemo interrupted")
         
         # Clean up
+        if timer is not None:
+            timer.close()
         clear_display(self.display)
         print("Demo complete")
 
@@ -9,15 +9,45 @@ by showing colored patterns and responding to button presses.
 import argparse
 import time
 from PIL import Image, ImageDraw
-import colorsys
 import sys
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy code path is used instead
+    njit = None
+
 try:
-    from unicornhatutils import UnicornHATMini, display_info_message, clear_display
+    from unicornhatutils import UnicornHATMini, display_info_message, clear_display, blit
 except ImportError:
     print("Error: Could not import from unicornhatutils. Make sure unicornhatutils.py is in the same directory.")
     exit(1)
 
+from animation.colors import HUE_TABLE
+from animation.timing import FrameTimer
+
+
+def _fill_rainbow_numpy(frame, lut, offset):
+    """Fill frame with the rainbow pattern at offset."""
+    height, width = frame.shape[:2]
+    # Hue (x + y + offset) / (width + height) of every pixel, as a LUT index
+    steps = np.add.outer(np.arange(height), np.arange(width)) + offset
+    frame[:] = lut[(steps * len(lut) // (width + height)) % len(lut)]
+
+
+def _fill_rainbow_loop(frame, lut, offset):
+    """Fill frame with the rainbow pattern at offset, pixel by pixel (for Numba)."""
+    height, width = frame.shape[:2]
+    for y in range(height):
+        for x in range(width):
+            index = ((x + y + offset) * lut.shape[0] // (width + height)) % lut.shape[0]
+            for c in range(3):
+                frame[y, x, c] = lut[index, c]
+
+
+_fill_rainbow = _fill_rainbow_numpy if njit is None else njit(cache=True)(_fill_rainbow_loop)
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Display tester for Unicorn HAT Mini')
@@ -46,46 +76,41 @@ def draw_solid(display, color):
     display.show()
 
 
-def draw_rainbow(display, offset=0):
-    """Draw a rainbow pattern."""
-    width, height = display.get_shape()
-    for y in range(height):
-        for x in range(width):
-            hue = (x + y + offset) / float(width + height)
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-            display.set_pixel(x, y, r, g, b)
+def draw_rainbow(display, offset=0, frame=None):
+    """Draw a rainbow pattern.
+    
+    Pass the same frame, a (height, width, 3) uint8 array, on every call to
+    reuse it rather than allocate one each time.
+    """
+    if frame is None:
+        width, height = display.get_shape()
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+    _fill_rainbow(frame, HUE_TABLE, offset)
+    blit(display, frame)
     display.show()
 
 
 def draw_checkerboard(display, color1=(255, 255, 255), color2=(0, 0, 0)):
     """Draw a checkerboard pattern."""
     width, height = display.get_shape()
-    for y in range(height):
-        for x in range(width):
-            if (x + y) % 2 == 0:
-                display.set_pixel(x, y, *color1)
-            else:
-                display.set_pixel(x, y, *color2)
+    even = (np.add.outer(np.arange(height), np.arange(width)) % 2) == 0
+    frame = np.where(even[..., None], np.array(color1, dtype=np.uint8), np.array(color2, dtype=np.uint8))
+    blit(display, frame)
     display.show()
 
 
 def draw_gradient(display, start_color=(255, 0, 0), end_color=(0, 0, 255)):
     """Draw a gradient from left to right."""
     width, height = display.get_shape()
-    r1, g1, b1 = start_color
-    r2, g2, b2 = end_color
+    start = np.array(start_color)
+    end = np.array(end_color)
     
-    for x in range(width):
-        # Calculate color for this column
-        ratio = x / float(width - 1)
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        
-        # Fill the column with this color
-        for y in range(height):
-            display.set_pixel(x, y, r, g, b)
+    # Calculate the color of each column
+    ratio = np.arange(width)[:, None] / float(width - 1)
+    colors = (start + (end - start) * ratio).astype(np.uint8)
     
+    # Fill every row with the column colors
+    blit(display, np.broadcast_to(colors, (height, width, 3)))
     display.show()
 
 
@@ -131,33 +156,39 @@ def main():
     print("Press A, B, X, Y buttons to see events")
     print("Press Ctrl+C to exit")
     
+    timer = None
     try:
         # Initial pattern draw
         if pattern == 'solid':
             draw_solid(display, color)
         elif pattern == 'rainbow':
             offset = 0
+            width, height = display.get_shape()
+            frame = np.empty((height, width, 3), dtype=np.uint8)
         elif pattern == 'checkerboard':
             draw_checkerboard(display)
         elif pattern == 'gradient':
             draw_gradient(display)
         
         # Main loop for animations and button checking
+        timer = FrameTimer(0.05)
         while True:
             if pattern == 'rainbow':
-                draw_rainbow(display, offset)
+                draw_rainbow(display, offset, frame)
                 offset = (offset + 1) % 64
             
             # Process events
             display.process_events()
             
-            # Sleep to control animation speed and prevent CPU hogging
-            time.sleep(0.05)
+            # Wait until the next frame is due, to control animation speed
+            timer.wait()
     
     except KeyboardInterrupt:
         print("\nExiting...")
     finally:
         # Clean up and clear the display
+        if timer is not None:
+            timer.close()
         clear_display(display)
         print("Display cleared")
 
@@ -15,12 +15,14 @@ Press and hold any button to reset the rectangle to full size.
 
 import time
 import argparse
-import colorsys
+import functools
 import sys
 
+import numpy as np
+
 try:
     # Try to import from the unicornhatutils wrapper first (which works on macOS too)
-    from unicornhatutils import UnicornHATMini, display_info_message, clear_display
+    from unicornhatutils import UnicornHATMini, display_info_message, clear_display, blit
 except ImportError:
     try:
         # Fall back to the direct library (Raspberry Pi only)
@@ -39,12 +41,20 @@ except ImportError:
         def clear_display(display):
             display.clear()
             display.show()
+            
+        def blit(display, frame):
+            for y, row in enumerate(frame.tolist()):
+                for x, (r, g, b) in enumerate(row):
+                    display.set_pixel(x, y, r, g, b)
     except ImportError:
         print("Error: Could not import UnicornHATMini. Please make sure the library is installed.")
         print("For Raspberry Pi: sudo pip3 install unicornhatmini")
         print("For development on macOS: Place unicornhatutils.py and proxyunicornhatmini.py in the same directory.")
         exit(1)
 
+from animation.colors import HUE_TABLE
+from animation.timing import FrameTimer
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Interactive Rectangle Demo for Unicorn HAT Mini')
@@ -57,41 +67,59 @@ def parse_arguments():
 
 def get_rainbow_color(offset):
     """Get a color from the rainbow spectrum."""
-    hue = (time.time() / 5.0 + offset) % 1.0
-    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-    return r, g, b
+    return tuple(HUE_TABLE[int((time.monotonic() / 5.0 + offset) * 1536) % 1536].tolist())
 
 
-def draw_rectangle(display, top, left, bottom, right, width, height):
-    """Draw a colorful rectangle border on the display."""
-    display.clear()
+@functools.lru_cache(maxsize=64)
+def edge_pixels(top, left, bottom, right, width, height):
+    """Get the border pixels of a rectangle and their rainbow offsets.
     
-    # Make sure the rectangle is valid
-    top = max(0, min(top, height - 1))
-    left = max(0, min(left, width - 1))
-    bottom = max(top, min(bottom, height - 1))
-    right = max(left, min(right, width - 1))
+    Only the time-based hue shift changes from frame to frame, so this is
+    worked out once for each rectangle.
     
-    # Draw top edge
+    Returns:
+        Tuple of NumPy arrays (ys, xs, offsets), one entry per pixel
+    """
+    # Offset of each pixel, by (x, y); where edges overlap, the edge drawn
+    # later wins
+    offsets = {}
+    
+    # Top edge
     for x in range(left, right + 1):
-        color = get_rainbow_color(x / float(width))
-        display.set_pixel(x, top, *color)
+        offsets[x, top] = x / float(width)
     
-    # Draw bottom edge
+    # Bottom edge
     for x in range(left, right + 1):
-        color = get_rainbow_color(x / float(width) + 0.25)
-        display.set_pixel(x, bottom, *color)
+        offsets[x, bottom] = x / float(width) + 0.25
     
-    # Draw left edge
+    # Left edge
     for y in range(top + 1, bottom):
-        color = get_rainbow_color(y / float(height) + 0.5)
-        display.set_pixel(left, y, *color)
+        offsets[left, y] = y / float(height) + 0.5
     
-    # Draw right edge
+    # Right edge
     for y in range(top + 1, bottom):
-        color = get_rainbow_color(y / float(height) + 0.75)
-        display.set_pixel(right, y, *color)
+        offsets[right, y] = y / float(height) + 0.75
     
+    xs, ys = np.array(list(offsets), dtype=np.intp).T
+    return ys, xs, np.array(list(offsets.values()))
+
+
+def draw_rectangle(display, top, left, bottom, right, width, height):
+    """Draw a colorful rectangle border on the display."""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    
+    # Make sure the rectangle is valid
+    top = max(0, min(top, height - 1))
+    left = max(0, min(left, width - 1))
+    bottom = max(top, min(bottom, height - 1))
+    right = max(left, min(right, width - 1))
+    
+    # Color the border, shifting the hues with time as get_rainbow_color() does
+    ys, xs, offsets = edge_pixels(top, left, bottom, right, width, height)
+    hue = time.monotonic() / 5.0 + offsets
+    frame[ys, xs] = HUE_TABLE[(hue * 1536).astype(np.intp) % 1536]
+    
+    blit(display, frame)
     display.show()
 
 
@@ -117,55 +145,71 @@ def main():
     bottom = height - 1
     right = width - 1
     
+    # Button pins, bound once rather than looked up every frame
+    BUTTON_A = display.BUTTON_A
+    BUTTON_B = display.BUTTON_B
+    BUTTON_X = display.BUTTON_X
+    BUTTON_Y = display.BUTTON_Y
+    buttons = [("A", BUTTON_A), ("B", BUTTON_B), ("X", BUTTON_X), ("Y", BUTTON_Y)]
+    
+    # Read all the buttons at once, as a bitmask in the order of buttons,
+    # where the display supports it
+    read_buttons_bitmask = getattr(display, 'read_buttons_bitmask', None)
+    if read_buttons_bitmask is None:
+        def read_buttons_bitmask():
+            mask = 0
+            for bit, (_, pin) in enumerate(buttons):
+                if display.read_button(pin):
+                    mask |= 1 << bit
+            return mask
+    
     # Button press tracking
     button_press_times = {
-        display.BUTTON_A: 0,
-        display.BUTTON_B: 0,
-        display.BUTTON_X: 0,
-        display.BUTTON_Y: 0
+        BUTTON_A: 0,
+        BUTTON_B: 0,
+        BUTTON_X: 0,
+        BUTTON_Y: 0
     }
     
+    timer = None
     try:
         # Main loop
+        timer = FrameTimer(args.speed)
         while True:
             # Check for button presses
-            for button, pin in [
-                ("A", display.BUTTON_A),
-                ("B", display.BUTTON_B),
-                ("X", display.BUTTON_X),
-                ("Y", display.BUTTON_Y)
-            ]:
-                # Read current button state
-                is_pressed = display.read_button(pin)
+            pressed_mask = read_buttons_bitmask()
+            for bit, (button, pin) in enumerate(buttons):
+                # Current button state
+                is_pressed = pressed_mask >> bit & 1
                 
                 # Handle long press (for reset)
                 if is_pressed:
                     if button_press_times[pin] == 0:
-                        button_press_times[pin] = time.time()
-                    elif time.time() - button_press_times[pin] > 1.0:
+                        button_press_times[pin] = time.monotonic()
+                    elif time.monotonic() - button_press_times[pin] > 1.0:
                         # Long press detected - reset rectangle
                         print(f"Button {button} long press - resetting rectangle")
                         top = 0
                         left = 0
                         bottom = height - 1
                         right = width - 1
-                        button_press_times[pin] = time.time()  # Reset timer to prevent multiple triggers
+                        button_press_times[pin] = time.monotonic()  # Reset timer to prevent multiple triggers
                 else:
                     # Handle short press (edge movement)
                     if button_press_times[pin] > 0:
-                        press_duration = time.time() - button_press_times[pin]
+                        press_duration = time.monotonic() - button_press_times[pin]
                         if press_duration < 1.0:  # Short press
                             # Modify rectangle based on button
-                            if pin == display.BUTTON_A and top < bottom:
+                            if pin == BUTTON_A and top < bottom:
                                 top += 1
                                 print(f"Button {button} pressed - moving top edge down to {top}")
-                            elif pin == display.BUTTON_B and left < right:
+                            elif pin == BUTTON_B and left < right:
                                 left += 1
                                 print(f"Button {button} pressed - moving left edge right to {left}")
-                            elif pin == display.BUTTON_X and bottom > top:
+                            elif pin == BUTTON_X and bottom > top:
                                 bottom -= 1
                                 print(f"Button {button} pressed - moving bottom edge up to {bottom}")
-                            elif pin == display.BUTTON_Y and right > left:
+                            elif pin == BUTTON_Y and right > left:
                                 right -= 1
                                 print(f"Button {button} pressed - moving right edge left to {right}")
                         # Reset button timer
@@ -178,13 +222,15 @@ def main():
             if hasattr(display, 'process_events'):
                 display.process_events()
             
-            # Sleep to control animation speed
-            time.sleep(args.speed)
+            # Wait until the next frame is due, to control animation speed
+            timer.wait()
     
     except KeyboardInterrupt:
         print("\nExiting...")
     finally:
         # Clean up
+        if timer is not None:
+            timer.close()
         clear_display(display)
         print("Display cleared")
 
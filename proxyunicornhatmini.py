@@ -7,9 +7,64 @@ Simulates the UnicornHATMini hardware using pygame for display
 import pygame
 import sys
 import time
-import colorsys
+
+import numpy as np
 from PIL import Image
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy code path is used instead
+    njit = None
+
+
+def _image_to_buffer_loop(pixels, disp, offset_x, offset_y, wrap, bg_color, rotation, width, height):
+    """Copy an image into a pixel buffer, pixel by pixel (for Numba).
+    
+    Does the same as the NumPy path of set_image() followed by set_array():
+    display pixels are read from the image at an offset, wrapping or else
+    falling back to bg_color outside it, and rotated into the column-major
+    buffer as set_pixel() does.
+    """
+    image_height, image_width = pixels.shape[:2]
+    if rotation == 90 or rotation == 270:
+        display_width, display_height = height, width
+    else:
+        display_width, display_height = width, height
+    
+    for y in range(display_height):
+        for x in range(display_width):
+            # Buffer position of this display pixel
+            if rotation == 90:
+                bx, by = y, width - 1 - x
+            elif rotation == 180:
+                bx, by = width - 1 - x, height - 1 - y
+            elif rotation == 270:
+                bx, by = height - 1 - y, x
+            else:
+                bx, by = x, y
+            if not (0 <= bx < width and 0 <= by < height):
+                continue
+            offset = bx * height + by
+            
+            # Image position of this display pixel
+            ix = x + offset_x
+            iy = y + offset_y
+            if wrap:
+                ix %= image_width
+                iy %= image_height
+            
+            if 0 <= ix < image_width and 0 <= iy < image_height:
+                for c in range(3):
+                    disp[offset, c] = pixels[iy, ix, c]
+            else:
+                for c in range(3):
+                    disp[offset, c] = bg_color[c]
+
+
+# Without Numba, set_image() uses NumPy indexing instead
+_image_to_buffer = None if njit is None else njit(cache=True)(_image_to_buffer_loop)
+
+
 class UnicornHATMiniBase:
     # Constants matching the actual Unicorn HAT Mini
     WIDTH = 17
@@ -25,10 +80,12 @@ class UnicornHATMiniBase:
         """Initialize proxy Unicorn HAT Mini emulator"""
         # We ignore the SPI speed parameter since this is a simulation
         
-        # Initialize pixel data structure
-        self.disp = [[0, 0, 0] for _ in range(self.WIDTH * self.HEIGHT)]
+        # Pixel buffer: one RGB row per pixel, column-major like the
+        # hardware (offset = x * HEIGHT + y)
+        self.disp = np.zeros((self.WIDTH * self.HEIGHT, 3), dtype=np.uint8)
         self.brightness = 0.5
         self._rotation = 0
+        self._pixel_offsets = self._get_pixel_offsets()
         self.button_states = {
             self.BUTTON_A: False,
             self.BUTTON_B: False,
@@ -37,9 +94,20 @@ class UnicornHATMiniBase:
         }
         self.button_callback = None
         
+        # Pixel buffer offsets for set_array(), per rotation
+        self._array_offsets = {}
+        
         # Scale factor for larger display (makes it easier to see)
         self.scale = 15
         
+        # Which screen pixels are on the thin border drawn around each
+        # pixel, indexed by screen column and row like pygame.surfarray
+        cell_x = np.arange(self.WIDTH * self.scale) % self.scale
+        cell_y = np.arange(self.HEIGHT * self.scale) % self.scale
+        on_edge_x = (cell_x == 0) | (cell_x == self.scale - 1)
+        on_edge_y = (cell_y == 0) | (cell_y == self.scale - 1)
+        self._border_mask = on_edge_x[:, None] | on_edge_y[None, :]
+        
         # Initialize pygame
         pygame.init()
         self.screen = pygame.display.set_mode((self.WIDTH * self.scale, self.HEIGHT * self.scale))
@@ -62,21 +130,36 @@ class UnicornHATMiniBase:
     
     def set_pixel(self, x, y, r, g, b):
         """Set a single pixel."""
-        if self._rotation == 90:
-            x, y = y, self.WIDTH - 1 - x
-        elif self._rotation == 180:
-            x, y = self.WIDTH - 1 - x, self.HEIGHT - 1 - y
-        elif self._rotation == 270:
-            x, y = self.HEIGHT - 1 - y, x
-            
-        if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT:
-            offset = x * self.HEIGHT + y
-            self.disp[offset] = [r, g, b]
+        # Pixels that fall off the display have no offset
+        offset = self._pixel_offsets.get((x, y))
+        if offset is not None:
+            self.disp[offset] = (r, g, b)
+    
+    def _get_pixel_offsets(self):
+        """Map each (x, y) position on the display to its pixel buffer offset.
+        
+        Built for the current rotation by turning each pixel of the buffer
+        back into the position that rotates onto it.
+        """
+        offsets = {}
+        for bx in range(self.WIDTH):
+            for by in range(self.HEIGHT):
+                if self._rotation == 90:
+                    x, y = self.WIDTH - 1 - by, bx
+                elif self._rotation == 180:
+                    x, y = self.WIDTH - 1 - bx, self.HEIGHT - 1 - by
+                elif self._rotation == 270:
+                    x, y = by, self.HEIGHT - 1 - bx
+                else:
+                    x, y = bx, by
+                
+                # The pixel buffer is column-major
+                offsets[(x, y)] = bx * self.HEIGHT + by
+        return offsets
     
     def set_all(self, r, g, b):
         """Set all pixels to the same color."""
-        for i in range(len(self.disp)):
-            self.disp[i] = [r, g, b]
+        self.disp[:] = (r, g, b)
     
     def set_brightness(self, brightness):
         """Set the display brightness (0.0 to 1.0)."""
@@ -87,6 +170,7 @@ class UnicornHATMiniBase:
         if rotation not in [0, 90, 180, 270]:
             raise ValueError("Rotation must be one of 0, 90, 180, 270")
         self._rotation = rotation
+        self._pixel_offsets = self._get_pixel_offsets()
     
     def get_shape(self):
         """Return the display shape based on rotation."""
@@ -105,23 +189,62 @@ class UnicornHATMiniBase:
         
         if image.mode != "RGB":
             image = image.convert('RGB')
+        pixels = np.asarray(image)
+        
+        if _image_to_buffer is not None:
+            # Copy straight into the pixel buffer
+            _image_to_buffer(pixels, self.disp, offset_x, offset_y, wrap,
+                             np.array(bg_color, dtype=np.uint8), self._rotation,
+                             self.WIDTH, self.HEIGHT)
+            return
         
         display_width, display_height = self.get_shape()
         
-        for y in range(display_height):
-            for x in range(display_width):
-                r, g, b = bg_color
-                i_x = x + offset_x
-                i_y = y + offset_y
-                
-                if wrap:
-                    i_x = i_x % image_width
-                    i_y = i_y % image_height
-                
-                if 0 <= i_x < image_width and 0 <= i_y < image_height:
-                    r, g, b = image.getpixel((i_x, i_y))
-                
-                self.set_pixel(x, y, r, g, b)
+        # Image coordinates of each display column and row
+        i_x = np.arange(display_width) + offset_x
+        i_y = np.arange(display_height) + offset_y
+        if wrap:
+            i_x %= image_width
+            i_y %= image_height
+        in_x = (i_x >= 0) & (i_x < image_width)
+        in_y = (i_y >= 0) & (i_y < image_height)
+        
+        # Pixels outside the image get the background color
+        frame = np.empty((display_height, display_width, 3), dtype=np.uint8)
+        frame[:] = bg_color
+        frame[np.ix_(in_y, in_x)] = pixels[np.ix_(i_y[in_y], i_x[in_x])]
+        
+        self.set_array(frame)
+    
+    def set_array(self, array):
+        """Set all pixels from a (height, width, 3) array of RGB values."""
+        mapping = self._array_offsets.get(self._rotation)
+        if mapping is None:
+            mapping = self._array_offsets[self._rotation] = self._get_array_offsets()
+        offsets, inside = mapping
+        
+        # Reorder the pixels into the column-major buffer in one step
+        array = array.reshape(-1, 3)
+        if inside is None:
+            self.disp[offsets] = array
+        else:
+            # Like set_pixel(), leave pixels that fall off the display
+            self.disp[offsets] = array[inside]
+    
+    def _get_array_offsets(self):
+        """Map pixels, in row-major order, to pixel buffer offsets.
+        
+        Uses the same mapping as set_pixel(). Returns the offsets of the
+        pixels that land on the display, and a mask of which pixels those
+        are (None if all of them do).
+        """
+        display_width, display_height = self.get_shape()
+        pixel_offsets = self._pixel_offsets
+        offsets = np.array([pixel_offsets.get((x, y), -1)
+                            for y in range(display_height)
+                            for x in range(display_width)], dtype=np.intp)
+        inside = offsets >= 0
+        return offsets[inside], (None if inside.all() else inside)
     
     def on_button_pressed(self, callback):
         """Register callback for button events."""
@@ -133,38 +256,35 @@ class UnicornHATMiniBase:
         self._process_events()
         return self.button_states.get(pin, False)
     
+    def read_buttons_bitmask(self):
+        """Read the current state of all buttons at once.
+        
+        Returns:
+            Bitmask of the pressed buttons: bit 0 is button A, then B, X and Y
+        """
+        # Process any pending events, once for all buttons
+        self._process_events()
+        states = self.button_states
+        return (states[self.BUTTON_A]
+                | states[self.BUTTON_B] << 1
+                | states[self.BUTTON_X] << 2
+                | states[self.BUTTON_Y] << 3)
+    
     def show(self):
         """Update the display."""
         # Process any pending events
         self._process_events()
         
-        # Draw each pixel
-        for x in range(self.WIDTH):
-            for y in range(self.HEIGHT):
-                offset = x * self.HEIGHT + y
-                if offset < len(self.disp):
-                    r, g, b = self.disp[offset]
-                    # Apply brightness
-                    r = int(r * self.brightness)
-                    g = int(g * self.brightness)
-                    b = int(b * self.brightness)
-                    
-                    # Draw a rectangle for each pixel
-                    rect = pygame.Rect(
-                        x * self.scale, 
-                        y * self.scale, 
-                        self.scale, 
-                        self.scale
-                    )
-                    pygame.draw.rect(self.screen, (r, g, b), rect)
-                    
-                    # Draw a thin border around each pixel
-                    pygame.draw.rect(
-                        self.screen, 
-                        (64, 64, 64), 
-                        rect, 
-                        1
-                    )
+        # Apply brightness to the whole buffer at once, giving the color of
+        # each pixel by column and row
+        colors = (self.disp * self.brightness).astype(np.uint8)
+        colors = colors.reshape(self.WIDTH, self.HEIGHT, 3)
+        
+        # Scale each pixel up to a square of the screen, with a thin border
+        # around it, and draw the whole screen in one call
+        screen = colors.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+        screen[self._border_mask] = (64, 64, 64)
+        pygame.surfarray.blit_array(self.screen, screen)
         
         # Draw button state indicators
         self._draw_button_indicators()
@@ -230,20 +350,19 @@ class UnicornHATMiniBase:
 
 # Simple test if run directly
 if __name__ == "__main__":
+    from animation.colors import HUE_TABLE
+    
     unicornhatmini = UnicornHATMiniBase()
     
+    # Base hue of each pixel, in pixel buffer order (column by column)
+    x, y = np.mgrid[0:unicornhatmini.WIDTH, 0:unicornhatmini.HEIGHT]
+    base_hue = ((x + y) / 30.0).reshape(-1)
+    
     try:
         hue = 0
         while True:
-            # Create a rainbow pattern
-            for y in range(unicornhatmini.HEIGHT):
-                for x in range(unicornhatmini.WIDTH):
-                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(
-                        ((x + y) / 30.0 + hue) % 1.0, 
-                        1.0, 
-                        1.0
-                    )]
-                    unicornhatmini.set_pixel(x, y, r, g, b)
+            # Create a rainbow pattern, looking up all the hues at once
+            unicornhatmini.disp[:] = HUE_TABLE[((base_hue + hue) * 1536).astype(np.intp) % 1536]
             
             unicornhatmini.show()
             time.sleep(0.05)
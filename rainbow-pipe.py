@@ -28,17 +28,17 @@ In live feed mode:
 import argparse
 import time
 import math
-import colorsys
 import random
 import sys
 import threading
 import select
 import queue
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 
 # Try to import HAT Mini library with cross-platform support
 try:
-    from unicornhatutils import UnicornHATMini, display_info_message, clear_display
+    from unicornhatutils import UnicornHATMini, display_info_message, clear_display, blit
 except ImportError:
     try:
         from unicornhatmini import UnicornHATMini
@@ -52,12 +52,21 @@ except ImportError:
         def clear_display(display):
             display.clear()
             display.show()
+            
+        def blit(display, frame):
+            for y, row in enumerate(frame.tolist()):
+                for x, (r, g, b) in enumerate(row):
+                    display.set_pixel(x, y, r, g, b)
     except ImportError:
         print("Error: Could not import UnicornHATMini library.")
         print("Please install it with: sudo pip3 install unicornhatmini")
         print("Or place unicornhatutils.py in the same directory.")
         sys.exit(1)
 
+from animation.colors import HUE_COLORS
+from animation.fonts import load_font
+from animation.timing import FrameTimer
+
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -104,7 +113,7 @@ class InputReader(threading.Thread):
         self.livefeed_mode = livefeed_mode
         self.timeout = timeout
         self.running = True
-        self.last_input_time = time.time()
+        self.last_input_time = time.monotonic()
         self.buffer = ""
         self.static_on_enter = static_on_enter and livefeed_mode
     
@@ -132,18 +141,18 @@ class InputReader(threading.Thread):
                                         self.input_queue.put(line + '\0STATIC\0')
                                     else:
                                         self.input_queue.put(line + '\n')
-                        self.last_input_time = time.time()
+                        self.last_input_time = time.monotonic()
                 else:
                     # Send any remaining buffered content after a short pause
-                    if self.buffer and time.time() - self.last_input_time > self.timeout/2:
+                    if self.buffer and time.monotonic() - self.last_input_time > self.timeout/2:
                         self.input_queue.put(self.buffer)
                         self.buffer = ""
                     
                     # Check if we need to reset due to timeout
-                    if time.time() - self.last_input_time > self.timeout:
+                    if time.monotonic() - self.last_input_time > self.timeout:
                         # Send a reset signal (special marker that won't appear in normal text)
                         self.input_queue.put("\0RESET\0")  
-                        self.last_input_time = time.time()
+                        self.last_input_time = time.monotonic()
         else:
             # Normal mode - read lines
             for line in sys.stdin:
@@ -255,7 +264,7 @@ class RainbowPipeScroller:
         self.input_reader = InputReader(self.input_queue, livefeed_mode, timeout, static_on_enter)
         self.input_reader.start()
         self.text_buffer = initial_text
-        self.last_buffer_update = time.time()
+        self.last_buffer_update = time.monotonic()
         self.needs_redraw = True
         
         # Scrolling parameters
@@ -282,6 +291,9 @@ class RainbowPipeScroller:
         # Text image
         self.font = None
         self.text_image = None
+        self.text_mask = None
+        self.padded_mask = None
+        self.static_strip = None
         self.text_width = 0
         self.text_height = 0
         
@@ -308,11 +320,11 @@ class RainbowPipeScroller:
             # Load a font
             try:
                 if self.font_path:
-                    self.font = ImageFont.truetype(self.font_path, 8)
+                    self.font = load_font(self.font_path, 8)
                 else:
                     # Try to load a system font, fall back to default if not available
                     try:
-                        self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
+                        self.font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
                     except IOError:
                         self.font = ImageFont.load_default()
             except Exception as e:
@@ -323,6 +335,9 @@ class RainbowPipeScroller:
         """Update the text image based on the current text buffer."""
         if not self.text_buffer:
             self.text_image = Image.new("RGB", (1, self.height), (0, 0, 0))
+            self.text_mask = np.zeros((self.height, 1), dtype=bool)
+            self.pad_text_mask()
+            self.static_strip = None
             self.text_width = 1
             self.text_height = 0
             return
@@ -364,6 +379,11 @@ class RainbowPipeScroller:
             # Use PIL's text rendering with pixel-perfect mode
             draw.text((0, y_position), self.text_buffer, font=self.font, fill=(255, 255, 255))
         
+        # Which pixels of the text image are lit (not black)
+        self.text_mask = np.asarray(self.text_image).any(axis=-1)
+        self.pad_text_mask()
+        self.static_strip = None  # Rendered again when next needed
+        
         # Always reset scroll position to start from the right edge
         self.scroll_x = self.width
     
@@ -419,7 +439,7 @@ class RainbowPipeScroller:
         if new_input or reset_signal:
             self.update_text_image()
             self.needs_redraw = True
-            self.last_buffer_update = time.time()
+            self.last_buffer_update = time.monotonic()
     
     def change_speed(self):
         """Cycle through scroll speeds: slow -> medium -> fast -> slow..."""
@@ -468,7 +488,7 @@ class RainbowPipeScroller:
                 # Check if both buttons were pressed for at least 0.5 seconds
                 # We'll use the stored times in prev_button_states for this check
                 ab_press_time = self.prev_button_states.get('ab_press_time', 0)
-                if ab_press_time > 0 and time.time() - ab_press_time > 0.5:
+                if ab_press_time > 0 and time.monotonic() - ab_press_time > 0.5:
                     self.static_display = not self.static_display
                     print(f"[LiveFeed] Static display mode: {'enabled' if self.static_display else 'disabled'}")
                     self.needs_redraw = True
@@ -480,13 +500,13 @@ class RainbowPipeScroller:
                         self.scroll_x = self.width  # Reset scroll position
                         
                     # Reset button press time to avoid toggling multiple times
-                    self.prev_button_states['ab_press_time'] = time.time()
+                    self.prev_button_states['ab_press_time'] = time.monotonic()
                     return  # Skip normal button processing
             else:
                 # Start tracking A+B press time
                 if self.display.read_button(self.display.BUTTON_A) or self.display.read_button(self.display.BUTTON_B):
                     if 'ab_press_time' not in self.prev_button_states:
-                        self.prev_button_states['ab_press_time'] = time.time()
+                        self.prev_button_states['ab_press_time'] = time.monotonic()
         
         for button, action in buttons.items():
             # Get previous and current button state
@@ -501,13 +521,17 @@ class RainbowPipeScroller:
                 action()
                 self.needs_redraw = True
     
-    def get_pixel_color(self, x, text_x, y):
-        """Determine the color for a specific pixel based on the current color mode."""
+    def get_pixel_color(self, x, text_x, y, t=None):
+        """Determine the color for a specific pixel based on the current color mode.
+        
+        t is the current time, which is read from the clock if not given.
+        """
         # Get a normalized position of this character in the text (0.0 to 1.0)
         char_position = text_x / max(1, self.text_width)
         
         # Current time for animations
-        t = time.time()
+        if t is None:
+            t = time.monotonic()
         self.color_time = t
         
         # Different coloring modes
@@ -516,18 +540,18 @@ class RainbowPipeScroller:
         if mode == 'static_rainbow':
             # Each letter has a different fixed color
             hue = char_position
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'wave':
             # Rainbow wave flowing through the text
             hue = (char_position + t * 0.2) % 1.0
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'pulse':
             # All text pulses through colors together
             pulse_speed = 0.3  # Color cycles per second
             hue = (t * pulse_speed) % 1.0
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'random_flash':
             # Random letters flash to different colors
@@ -547,15 +571,66 @@ class RainbowPipeScroller:
                 if random.random() < 0.3:  # 30% chance per letter
                     hue = random.random()  # Completely random color
             
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
         
         else:
             # Fallback to static rainbow
             hue = char_position
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
         
         return r, g, b
     
+    def pad_text_mask(self):
+        """Pad the text mask with blank columns on both sides.
+        
+        A display width of blank columns goes on the left, and the gap plus
+        a display width on the right. Then the display window at any scroll
+        offset is a plain slice of the padded mask, see get_mask_window().
+        """
+        text_columns = self.text_mask.shape[1]
+        self.padded_mask = np.zeros((self.height, 2 * self.width + text_columns + self.gap_width), dtype=bool)
+        self.padded_mask[:, self.width:self.width + text_columns] = self.text_mask
+    
+    def get_mask_window(self, offset):
+        """Get the lit pixels under the display with the text at a scroll offset.
+        
+        Args:
+            offset: Display column of the left edge of the text, from the
+                right edge of the display down to where the text and the
+                gap after it have scrolled off the left edge
+            
+        Returns:
+            Boolean NumPy array of shape (height, width)
+        """
+        return self.padded_mask[:, self.width - offset:2 * self.width - offset]
+    
+    def get_static_frame(self, offset):
+        """Get the display frame of static rainbow text at a scroll offset.
+        
+        In static rainbow mode the color of each pixel depends only on its
+        position in the text, so the padded text mask is colored once, when
+        first needed, and each frame is a window of it like get_mask_window().
+        
+        Args:
+            offset: Display column of the left edge of the text
+            
+        Returns:
+            NumPy uint8 array of shape (height, width, 3)
+        """
+        if self.static_strip is None:
+            # Color the whole text once, a column at a time
+            text_columns = self.text_mask.shape[1]
+            colors = np.array([self.get_pixel_color(text_x, text_x, 0)
+                               for text_x in range(text_columns)], dtype=np.uint8)
+            self.static_strip = np.zeros(self.padded_mask.shape + (3,), dtype=np.uint8)
+            self.static_strip[:, self.width:self.width + text_columns] = self.text_mask[..., None] * colors
+        
+        return self.static_strip[:, self.width - offset:2 * self.width - offset]
+    
+    def draw_frame(self, frame):
+        """Draw a (height, width, 3) frame onto the display."""
+        blit(self.display, frame)
+    
     def update(self):
         """Update the display with the current frame of scrolling text."""
         # Check for new input
@@ -582,33 +657,41 @@ class RainbowPipeScroller:
         if not self.static_display and self.scroll_x < -self.text_width - self.gap_width:
             self.scroll_x = self.width  # Reset to start off-screen to the right
         
-        # Clear the display
-        self.display.clear()
-        
-        # Draw the text onto the display
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate position in the text image
-                text_x = x - int(self.scroll_x)
-                
-                # Check if this pixel is within the text bounds
-                if 0 <= text_x < self.text_width:
-                    # Get pixel from text image
-                    pixel = self.text_image.getpixel((text_x, y))
+        # Draw the text onto the display, with its left edge at this
+        # display column
+        offset = int(self.scroll_x)
+        if self.color_modes[self.current_color_mode] == 'static_rainbow':
+            # Same colors every time, so use the prerendered frame
+            self.draw_frame(self.get_static_frame(offset))
+        else:
+            # Read the clock once for the whole frame
+            t = time.monotonic()
+            window = self.get_mask_window(offset)
+            
+            if self.color_modes[self.current_color_mode] == 'random_flash':
+                # Colors are picked at random pixel by pixel
+                frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+                for y, x in np.argwhere(window).tolist():
+                    # Calculate position in the text image
+                    text_x = x - offset
                     
-                    # Apply color effects to non-background pixels
-                    if pixel != (0, 0, 0):
-                        # Get color
-                        r, g, b = self.get_pixel_color(x, text_x, y)
-                        
-                        # Set pixel
-                        self.display.set_pixel(x, y, r, g, b)
+                    # Get color
+                    frame[y, x] = self.get_pixel_color(x, text_x, y, t)
+            else:
+                # All pixels of a column have the same color, so get the
+                # color of each display column once
+                colors = np.array([self.get_pixel_color(x, x - offset, 0, t)
+                                   for x in range(self.width)], dtype=np.uint8)
+                frame = window[..., None] * colors
+            
+            self.draw_frame(frame)
         
         # Update the display
         self.display.show()
     
     def run(self):
         """Run the main loop of the text scroller."""
+        timer = None
         try:
             # Show welcome message if not in livefeed mode
             if not self.livefeed_mode:
@@ -622,6 +705,8 @@ class RainbowPipeScroller:
             if not is_pipe and not self.text_buffer:
                 print("Type text and press Enter (Ctrl+D to end):")
             
+            # Frame schedule, ~30 FPS
+            timer = FrameTimer(0.03)
             while True:
                 # Handle button presses
                 self.handle_buttons()
@@ -633,13 +718,15 @@ class RainbowPipeScroller:
                 if hasattr(self.display, 'process_events'):
                     self.display.process_events()
                 
-                # Short delay to control frame rate
-                time.sleep(0.03)  # ~30 FPS
+                # Wait until the next frame is due
+                timer.wait()
                 
         except KeyboardInterrupt:
             print("\nExiting...")
         finally:
             # Clean up
+            if timer is not None:
+                timer.close()
             self.input_reader.running = False
             clear_display(self.display)
             print("Display cleared")
@@ -14,14 +14,14 @@ Usage: python rainbow_text_scroller.py --text "Your text here"
 import argparse
 import time
 import math
-import colorsys
 import random
 import sys
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 
 # Try to import HAT Mini library with cross-platform support
 try:
-    from unicornhatutils import UnicornHATMini, display_info_message, clear_display
+    from unicornhatutils import UnicornHATMini, display_info_message, clear_display, blit
 except ImportError:
     try:
         from unicornhatmini import UnicornHATMini
@@ -35,12 +35,21 @@ except ImportError:
         def clear_display(display):
             display.clear()
             display.show()
+            
+        def blit(display, frame):
+            for y, row in enumerate(frame.tolist()):
+                for x, (r, g, b) in enumerate(row):
+                    display.set_pixel(x, y, r, g, b)
     except ImportError:
         print("Error: Could not import UnicornHATMini library.")
         print("Please install it with: sudo pip3 install unicornhatmini")
         print("Or place unicornhatutils.py in the same directory.")
         sys.exit(1)
 
+from animation.colors import HUE_COLORS
+from animation.fonts import load_font
+from animation.timing import FrameTimer
+
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -94,6 +103,9 @@ class RainbowTextScroller:
         self.color_time = 0          # For time-based effects
         self.flash_countdown = 0     # For random flash effect
         
+        # Static rainbow colored padded text, see get_static_frame()
+        self.static_strip = None
+        
         # Set up text rendering
         self.setup_text()
         
@@ -110,11 +122,11 @@ class RainbowTextScroller:
         # Load a font
         try:
             if self.font_path:
-                self.font = ImageFont.truetype(self.font_path, 8)
+                self.font = load_font(self.font_path, 8)
             else:
                 # Try to load a system font, fall back to default if not available
                 try:
-                    self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
+                    self.font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
                 except IOError:
                     self.font = ImageFont.load_default()
         except Exception as e:
@@ -140,6 +152,11 @@ class RainbowTextScroller:
         # Draw the text in the buffer
         y_position = self.baseline_y - self.text_height // 2
         draw.text((0, y_position), self.text, font=self.font, fill=(255, 255, 255))
+        
+        # Which pixels of the text image are lit (not black)
+        self.text_mask = np.asarray(self.text_image).any(axis=-1)
+        self.pad_text_mask()
+        self.static_strip = None  # Rendered again when next needed
     
     def change_speed(self):
         """Cycle through scroll speeds: slow -> medium -> fast -> slow..."""
@@ -191,13 +208,17 @@ class RainbowTextScroller:
             if curr_state and not prev_state:
                 action()
     
-    def get_pixel_color(self, x, text_x, y):
-        """Determine the color for a specific pixel based on the current color mode."""
+    def get_pixel_color(self, x, text_x, y, t=None):
+        """Determine the color for a specific pixel based on the current color mode.
+        
+        t is the current time, which is read from the clock if not given.
+        """
         # Get a normalized position of this character in the text (0.0 to 1.0)
         char_position = text_x / self.text_width
         
         # Current time for animations
-        t = time.time()
+        if t is None:
+            t = time.monotonic()
         self.color_time = t
         
         # Different coloring modes
@@ -206,18 +227,18 @@ class RainbowTextScroller:
         if mode == 'static_rainbow':
             # Each letter has a different fixed color
             hue = char_position
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'wave':
             # Rainbow wave flowing through the text
             hue = (char_position + t * 0.2) % 1.0
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'pulse':
             # All text pulses through colors together
             pulse_speed = 0.3  # Color cycles per second
             hue = (t * pulse_speed) % 1.0
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
             
         elif mode == 'random_flash':
             # Random letters flash to different colors
@@ -237,20 +258,68 @@ class RainbowTextScroller:
                 if random.random() < 0.3:  # 30% chance per letter
                     hue = random.random()  # Completely random color
             
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
         
         else:
             # Fallback to static rainbow
             hue = char_position
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+            r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
         
         return r, g, b
     
+    def pad_text_mask(self):
+        """Pad the text mask with blank columns on both sides.
+        
+        A display width of blank columns goes on the left, and the gap plus
+        a display width on the right. Then the display window at any scroll
+        offset is a plain slice of the padded mask, see get_mask_window().
+        """
+        text_columns = self.text_mask.shape[1]
+        self.padded_mask = np.zeros((self.height, 2 * self.width + text_columns + self.gap_width), dtype=bool)
+        self.padded_mask[:, self.width:self.width + text_columns] = self.text_mask
+    
+    def get_mask_window(self, offset):
+        """Get the lit pixels under the display with the text at a scroll offset.
+        
+        Args:
+            offset: Display column of the left edge of the text, from the
+                right edge of the display down to where the text and the
+                gap after it have scrolled off the left edge
+            
+        Returns:
+            Boolean NumPy array of shape (height, width)
+        """
+        return self.padded_mask[:, self.width - offset:2 * self.width - offset]
+    
+    def get_static_frame(self, offset):
+        """Get the display frame of static rainbow text at a scroll offset.
+        
+        In static rainbow mode the color of each pixel depends only on its
+        position in the text, so the padded text mask is colored once, when
+        first needed, and each frame is a window of it like get_mask_window().
+        
+        Args:
+            offset: Display column of the left edge of the text
+            
+        Returns:
+            NumPy uint8 array of shape (height, width, 3)
+        """
+        if self.static_strip is None:
+            # Color the whole text once, a column at a time
+            text_columns = self.text_mask.shape[1]
+            colors = np.array([self.get_pixel_color(text_x, text_x, 0)
+                               for text_x in range(text_columns)], dtype=np.uint8)
+            self.static_strip = np.zeros(self.padded_mask.shape + (3,), dtype=np.uint8)
+            self.static_strip[:, self.width:self.width + text_columns] = self.text_mask[..., None] * colors
+        
+        return self.static_strip[:, self.width - offset:2 * self.width - offset]
+    
+    def draw_frame(self, frame):
+        """Draw a (height, width, 3) frame onto the display."""
+        blit(self.display, frame)
+    
     def update(self):
         """Update the display with the current frame of scrolling text."""
-        # Clear the display
-        self.display.clear()
-        
         # Update the scroll position
         self.scroll_x -= self.scroll_step
         
@@ -258,35 +327,48 @@ class RainbowTextScroller:
         if self.scroll_x < -self.text_width - self.gap_width:
             self.scroll_x = self.width  # Reset to start off-screen to the right
         
-        # Draw the text onto the display
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate position in the text image
-                text_x = x - int(self.scroll_x)
-                
-                # Check if this pixel is within the text bounds
-                if 0 <= text_x < self.text_width:
-                    # Get pixel from text image
-                    pixel = self.text_image.getpixel((text_x, y))
+        # Draw the text onto the display, with its left edge at this
+        # display column
+        offset = int(self.scroll_x)
+        if self.color_modes[self.current_color_mode] == 'static_rainbow':
+            # Same colors every time, so use the prerendered frame
+            self.draw_frame(self.get_static_frame(offset))
+        else:
+            # Read the clock once for the whole frame
+            t = time.monotonic()
+            window = self.get_mask_window(offset)
+            
+            if self.color_modes[self.current_color_mode] == 'random_flash':
+                # Colors are picked at random pixel by pixel
+                frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+                for y, x in np.argwhere(window).tolist():
+                    # Calculate position in the text image
+                    text_x = x - offset
                     
-                    # Apply color effects to non-background pixels
-                    if pixel != (0, 0, 0):
-                        # Get color
-                        r, g, b = self.get_pixel_color(text_x, text_x, y)
-                        
-                        # Set pixel
-                        self.display.set_pixel(x, y, r, g, b)
+                    # Get color
+                    frame[y, x] = self.get_pixel_color(text_x, text_x, y, t)
+            else:
+                # All pixels of a column have the same color, so get the
+                # color of each display column once
+                colors = np.array([self.get_pixel_color(x - offset, x - offset, 0, t)
+                                   for x in range(self.width)], dtype=np.uint8)
+                frame = window[..., None] * colors
+            
+            self.draw_frame(frame)
         
         # Update the display
         self.display.show()
     
     def run(self):
         """Run the main loop of the text scroller."""
+        timer = None
         try:
             # Show welcome message
             display_info_message(self.display, "Rainbow", "Text Scroller")
             time.sleep(1)
             
+            # Frame schedule, ~30 FPS
+            timer = FrameTimer(0.03)
             while True:
                 # Handle button presses
                 self.handle_buttons()
@@ -298,13 +380,15 @@ class RainbowTextScroller:
                 if hasattr(self.display, 'process_events'):
                     self.display.process_events()
                 
-                # Short delay to control frame rate
-                time.sleep(0.03)  # ~30 FPS
+                # Wait until the next frame is due
+                timer.wait()
                 
         except KeyboardInterrupt:
             print("\nExiting...")
         finally:
             # Clean up
+            if timer is not None:
+                timer.close()
             clear_display(self.display)
             print("Display cleared")
 
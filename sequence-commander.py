@@ -50,6 +50,8 @@ except ImportError:
         print("For development on macOS: Place unicornhatutils.py and proxyunicornhatmini.py in the same directory.")
         exit(1)
 
+from animation.colors import HUE_COLORS
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Sequence Commander for Unicorn HAT Mini')
@@ -329,7 +331,7 @@ class SequenceCommander:
                 if normalized_distance < intensity * 0.35:
                     brightness = 1.0 - (normalized_distance / (intensity * 0.35))
                     hue = (time.time() / 10.0) % 1.0
-                    r, g, b = [int(c * 255 * brightness) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+                    r, g, b = [int(c * brightness) for c in HUE_COLORS[int(hue * 1536) % 1536]]
                     self.display.set_pixel(x, y, r, g, b)
         
         self.display.show()
@@ -372,7 +374,7 @@ class SequenceCommander:
                 if abs(radius - spiral_r % max_radius) < 1.0:
                     # Color based on angle
                     hue = (spiral_angle / (2 * math.pi) + elapsed / 2) % 1.0
-                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+                    r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
                     self.display.set_pixel(x, y, r, g, b)
         
         self.display.show()
@@ -434,14 +436,12 @@ class SequenceCommander:
                     # Color based on angle and progress (shifts from yellow/orange to red)
                     angle = math.atan2(y - center_y, x - center_x)
                     hue = (0.05 - 0.05 * progress) % 1.0  # Shift from yellow (0.15) to red (0.0)
-                    saturation = 1.0
-                    brightness = 1.0
                     
                     # Add some variation based on angle
                     hue_variation = 0.05 * math.sin(angle * 5 + elapsed * 3)
                     hue = (hue + hue_variation) % 1.0
                     
-                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, saturation, brightness)]
+                    r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
                     self.display.set_pixel(x, y, r, g, b)
                 
                 # Also draw some "sparks" in the center
@@ -571,8 +571,6 @@ class SequenceCommander:
     
     def rainbow_wave_animation(self):
         """Create a rainbow wave flowing across the display."""
-        self.display.clear()
-        
         # Calculate animation progress
         elapsed = time.time() - self.animation_start_time
         
@@ -592,7 +590,7 @@ class SequenceCommander:
                 # Add time-based shift to make colors move
                 hue = (hue + elapsed / 5.0) % 1.0
                 
-                r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+                r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
                 self.display.set_pixel(x, y, r, g, b)
         
         self.display.show()
@@ -5,7 +5,6 @@ This simple script creates a single test animation and runs it with debugging en
 """
 
 import time
-import colorsys
 import argparse
 
 try:
@@ -19,6 +18,8 @@ except ImportError:
         print("Error: Could not import UnicornHATMini.")
         exit(1)
 
+from animation.colors import HUE_COLORS
+
 
 class TestAnimation:
     """Simple test animation with debug output."""
@@ -58,7 +59,7 @@ class TestAnimation:
                 hue = hue % 1.0
                 
                 # Convert HSV to RGB
-                r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+                r, g, b = HUE_COLORS[int(hue * 1536) % 1536]
                 
                 # Set the pixel
                 self.display.set_pixel(x, y, r, g, b)
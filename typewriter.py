@@ -35,6 +35,8 @@ import os
 import select
 from collections import deque
 
+from animation.colors import HUE_COLORS
+
 # Try to import the Unicorn HAT Mini library
 try:
     from unicornhatmini import UnicornHATMini
@@ -193,8 +195,7 @@ def get_color(mode, position=0, time_offset=0):
     elif mode == COLOR_MODE_RAINBOW:
         # Generate a color from the rainbow spectrum
         hue = ((position * 0.1) + time_offset) % 1.0
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-        return (r, g, b)
+        return HUE_COLORS[int(hue * 1536) % 1536]
     elif mode == COLOR_MODE_MONOCHROME:
         # Monochrome cyan with slight variations
         base = 200
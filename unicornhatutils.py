@@ -9,8 +9,13 @@ import os
 import platform
 import sys
 import time
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
+# Frame pacing and fonts, shared with the animation package
+from animation.fonts import load_font
+from animation.timing import FrameTimer
+
 # First, determine which UnicornHATMini implementation to use based on platform
 if platform.system() == "Darwin":  # macOS
     try:
@@ -26,6 +31,11 @@ else:  # Raspberry Pi or other Linux system
     except ImportError:
         raise ImportError("Error: Unicorn HAT Mini library not found. Please install it with: sudo pip3 install unicornhatmini")
 
+# unicornhatmini releases whose private pixel buffer (disp) set_array() may
+# write to directly. The buffer is not part of the library's API, so any
+# other version is drawn with set_pixel() instead.
+PIXEL_BUFFER_VERSIONS = ("0.0.2",)
+
 
 class UnicornHATMini:
     """
@@ -47,6 +57,13 @@ class UnicornHATMini:
         # Initialize button state
         self.button_callback = None
         
+        # Whether set_array() may write the library's pixel buffer, and
+        # the buffer layout, learned from set_pixel() when first needed
+        library = sys.modules.get(type(self.unicorn).__module__)
+        self._pixel_buffer = (self._platform == "actual" and hasattr(self.unicorn, 'disp')
+                              and getattr(library, '__version__', None) in PIXEL_BUFFER_VERSIONS)
+        self._array_layout = None
+        
         # For actual hardware, import and setup GPIOZero buttons
         if self._platform == "actual":
             try:
@@ -106,6 +123,117 @@ class UnicornHATMini:
                 return self.buttons[pin].is_pressed
         return False
     
+    def read_buttons_bitmask(self):
+        """
+        Read the current state of all buttons at once.
+        Works across both proxy and actual implementations.
+        
+        Returns:
+            Bitmask of the pressed buttons: bit 0 is button A, then B, X and Y
+        """
+        if self._platform == "proxy":
+            # For the proxy, use its built-in method
+            if hasattr(self.unicorn, 'read_buttons_bitmask'):
+                return self.unicorn.read_buttons_bitmask()
+        
+        # Otherwise combine the individual button states
+        mask = 0
+        for bit, pin in enumerate((self.BUTTON_A, self.BUTTON_B, self.BUTTON_X, self.BUTTON_Y)):
+            if self.read_button(pin):
+                mask |= 1 << bit
+        return mask
+    
+    def set_array(self, array):
+        """
+        Set all pixels from a NumPy array in one step.
+        Works across both proxy and actual implementations.
+        
+        On actual hardware with a library version in PIXEL_BUFFER_VERSIONS
+        the pixels are copied straight into the library's pixel buffer,
+        rather than through 119 set_pixel() calls.
+        
+        Args:
+            array: NumPy array of shape (height, width, 3) with values 0-255
+        """
+        if not self._pixel_buffer:
+            if hasattr(self.unicorn, 'set_array'):
+                return self.unicorn.set_array(array)
+            # Without a pixel buffer to write to, set the pixels one at a time
+            for y, row in enumerate(np.asarray(array).tolist()):
+                for x, (r, g, b) in enumerate(row):
+                    self.unicorn.set_pixel(x, y, r, g, b)
+            return
+        
+        if self._array_layout is None:
+            self._array_layout = self._learn_array_layout()
+        offsets, inside, levels = self._array_layout
+        
+        # Scale the colors as set_pixel() does and reorder the pixels into
+        # the buffer, with one slice assignment
+        pixels = levels[np.asarray(array).reshape(-1, 3).astype(np.intp)]
+        disp = self.unicorn.disp
+        if inside is None:
+            buffer = np.empty((len(disp), 3), dtype=np.intp)
+            buffer[offsets] = pixels
+        else:
+            # Like set_pixel(), leave pixels that fall off the display
+            buffer = np.array(disp, dtype=np.intp)
+            buffer[offsets] = pixels[inside]
+        disp[:] = buffer.tolist()
+    
+    def _learn_array_layout(self):
+        """
+        Find how set_pixel() fills the library's pixel buffer.
+        
+        Sets test pixels, then restores the buffer. Returns the buffer offset
+        of each pixel in row-major order that lands on the display, a mask
+        of which pixels those are (None if all of them do), and the buffer
+        value for each color level 0-255.
+        """
+        disp = self.unicorn.disp
+        saved = [list(pixel) for pixel in disp]
+        width, height = self.get_shape()
+        
+        try:
+            # Light one pixel at a time on a blank buffer to find its offset
+            offsets = []
+            for y in range(height):
+                for x in range(width):
+                    disp[:] = [[0, 0, 0] for _ in saved]
+                    self.unicorn.set_pixel(x, y, 255, 255, 255)
+                    lit = [i for i, pixel in enumerate(disp) if any(pixel)]
+                    offsets.append(lit[0] if lit else -1)
+            
+            # Record the stored value for every color level, using the
+            # first pixel that lands on the display
+            levels = list(range(256))
+            index = next((i for i, offset in enumerate(offsets) if offset >= 0), None)
+            if index is not None:
+                for level in range(256):
+                    self.unicorn.set_pixel(index % width, index // width, level, level, level)
+                    levels[level] = disp[offsets[index]][0]
+        finally:
+            disp[:] = saved
+        
+        offsets = np.array(offsets, dtype=np.intp)
+        inside = offsets >= 0
+        if inside.all():
+            return offsets, None, np.array(levels, dtype=np.intp)
+        return offsets[inside], inside, np.array(levels, dtype=np.intp)
+    
+    def set_rotation(self, rotation=0):
+        """
+        Set the display rotation.
+        Works across both proxy and actual implementations.
+        
+        Args:
+            rotation: Rotation in degrees (0, 90, 180, or 270)
+        """
+        self.unicorn.set_rotation(rotation)
+        
+        # The pixel buffer layout depends on the rotation
+        self._array_layout = None
+    
     def process_events(self):
         """
         Process events (needed for proxy implementation).
@@ -187,8 +315,8 @@ def display_info_message(display, message, submessage=""):
     
     # Try to load a font, fall back to default if necessary
     try:
-        main_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 8)
-        sub_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 6)
+        main_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 8)
+        sub_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 6)
     except IOError:
         main_font = ImageFont.load_default()
         sub_font = ImageFont.load_default()
@@ -222,11 +350,8 @@ def display_info_message(display, message, submessage=""):
         
         draw.text((subtext_x, subtext_y), submessage, font=sub_font, fill=(200, 200, 200))
     
-    # Set each pixel on the Unicorn HAT Mini
-    for y in range(height):
-        for x in range(width):
-            r, g, b = image.getpixel((x, y))
-            display.set_pixel(x, y, r, g, b)
+    # Set the pixels on the Unicorn HAT Mini from the image data in one go
+    blit(display, np.asarray(image))
     
     # Update the display
     display.show()
@@ -254,6 +379,26 @@ def load_image(image_path):
         print(f"Error loading image {image_path}: {e}")
         return None
 
+def blit(display, frame):
+    """
+    Draw a whole frame onto the display.
+    
+    Uses the display's set_array() where it has one, as the proxy does, to
+    set every pixel in one call; otherwise sets the pixels one at a time.
+    
+    Args:
+        display: UnicornHATMini instance
+        frame: NumPy uint8 array of shape (height, width, 3)
+    """
+    set_array = getattr(display, 'set_array', None)
+    if set_array is not None:
+        set_array(frame)
+        return
+    
+    for y, row in enumerate(frame.tolist()):
+        for x, (r, g, b) in enumerate(row):
+            display.set_pixel(x, y, r, g, b)
+
 def clear_display(display):
     """
     Clear the display with a black screen.
@@ -263,4 +408,4 @@ def clear_display(display):
     """
     display.clear()
     display.show()
-    display.set_brightness(0)  # Turn off backlight completely
\ No newline at end of file
+    display.set_brightness(0)  # Turn off backlight completely